@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic benchmark fixtures laid out as a fake home directory:
+
+  <home>/.clawdbot/agents/main/sessions/*.jsonl   session transcripts
+  <home>/clawd/memory/logs/YYYY-MM-DD.md          daily logs
+  <home>/clawd/memory/projects/*.md               project docs
+  <home>/clawd/{MEMORY,IDENTITY,USER}.md          core files
+
+Point HOME at the generated directory and the sync, import and watch
+scripts pick the fixtures up unchanged. Output is deterministic per seed.
+
+Usage: fixtures.py <home_dir> [--messages 10000] [--seed 0]
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+MESSAGES_PER_SESSION = 2000
+SECTIONS_PER_LOG = 8
+MESSAGES_PER_LOG_SECTION = 25
+
+WORDS = (
+    "deploy invoice portfolio vendor password roadmap dinner meeting budget "
+    "server backup calendar contract flight renewal dashboard migration "
+    "accountant schedule feature release decided fixed configured completed "
+    "updated created rotated reviewed scheduled approved neo4j graphiti qmd"
+).split()
+
+# Noise lines the session sync is expected to skip
+NOISE = [
+    "HEARTBEAT",
+    "NO_REPLY",
+    "[Slack #general] ping",
+    "System: context compacted",
+    "ok",
+]
+
+
+def sentence(rng, min_words=8, max_words=40):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def session_entry(rng, index, timestamp):
+    """Build one session JSONL entry in the shape graphiti-sync-sessions.py reads."""
+    roll = rng.random()
+    if roll < 0.05:
+        return {"type": "tool_result", "id": f"t-{index}", "timestamp": timestamp}
+    role = "user" if index % 2 == 0 else "assistant"
+    if roll < 0.12:
+        text = rng.choice(NOISE)
+    else:
+        text = " ".join(sentence(rng) for _ in range(rng.randint(1, 4)))
+    content = text if role == "user" else [{"type": "text", "text": text}]
+    return {
+        "type": "message",
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "timestamp": timestamp,
+        "message": {"role": role, "content": content},
+    }
+
+
+def generate_sessions(home, messages, rng):
+    """Write `messages` session entries spread over several JSONL files."""
+    sessions_dir = home / ".clawdbot/agents/main/sessions"
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    start = datetime(2026, 1, 1, 9, 0, 0)
+    written = 0
+    session_no = 0
+    while written < messages:
+        count = min(MESSAGES_PER_SESSION, messages - written)
+        path = sessions_dir / f"session-{session_no:05d}.jsonl"
+        with open(path, "w") as f:
+            for i in range(count):
+                ts = (start + timedelta(seconds=written + i)).isoformat() + "Z"
+                f.write(json.dumps(session_entry(rng, written + i, ts)) + "\n")
+        written += count
+        session_no += 1
+    return session_no
+
+
+def generate_memory_tree(home, messages, rng):
+    """Write daily logs, project docs and core files sized relative to `messages`."""
+    clawd = home / "clawd"
+    logs_dir = clawd / "memory/logs"
+    projects_dir = clawd / "memory/projects"
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    projects_dir.mkdir(parents=True, exist_ok=True)
+
+    days = max(1, messages // (SECTIONS_PER_LOG * MESSAGES_PER_LOG_SECTION))
+    start = datetime(2026, 1, 1)
+    for day in range(days):
+        date = (start + timedelta(days=day)).strftime("%Y-%m-%d")
+        parts = [f"# {date}\n"]
+        for section in range(SECTIONS_PER_LOG):
+            hour = 8 + section
+            parts.append(f"## {rng.choice(WORDS).capitalize()} work ({hour}:{rng.randint(0, 59):02d} AST)")
+            parts.extend(f"- {sentence(rng)}" for _ in range(rng.randint(2, 6)))
+            parts.append("")
+        (logs_dir / f"{date}.md").write_text("\n".join(parts))
+
+    projects = max(1, days // 10)
+    for n in range(projects):
+        body = "\n".join(f"- {sentence(rng)}" for _ in range(rng.randint(10, 60)))
+        (projects_dir / f"project-{n:04d}.md").write_text(f"# Project {n}\n\n## Decisions\n{body}\n")
+
+    for name in ("MEMORY.md", "IDENTITY.md", "USER.md"):
+        body = "\n".join(f"- {sentence(rng)}" for _ in range(40))
+        (clawd / name).write_text(f"# {name}\n\n## Notes\n{body}\n")
+
+    return days, projects
+
+
+def touch_memory_tree(home, fraction, rng):
+    """Append a line to a fraction of the daily logs, for incremental watch runs."""
+    logs = sorted((home / "clawd/memory/logs").glob("*.md"))
+    changed = rng.sample(logs, max(1, int(len(logs) * fraction))) if logs else []
+    for path in changed:
+        with open(path, "a") as f:
+            f.write(f"\n## Follow-up ({rng.randint(10, 20)}:00 AST)\n- {sentence(rng)}\n")
+    return len(changed)
+
+
+def generate(home, messages, seed=0):
+    """Generate a complete fixture home. Returns a summary dict."""
+    home = Path(home)
+    rng = random.Random(seed)
+    sessions = generate_sessions(home, messages, rng)
+    days, projects = generate_memory_tree(home, messages, rng)
+    return {
+        "home": str(home),
+        "messages": messages,
+        "session_files": sessions,
+        "daily_logs": days,
+        "project_docs": projects,
+        "seed": seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Graphiti benchmark fixtures")
+    parser.add_argument("home", help="Directory to use as the fake $HOME")
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(generate(args.home, args.messages, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Graphiti REST API used by the benchmark suite.
+Implements /healthcheck, /messages and /search with configurable latency
+and error injection, so ingestion and search can be measured without the
+Graphiti + Neo4j + OpenAI stack.
+
+Usage: mock_graphiti.py [--port 8001] [--latency-ms 0] [--jitter-ms 0]
+                        [--error-rate 0.0] [--seed 0]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Keep only the most recent messages per group for /search, so a 1M message
+# run does not turn the stand-in into the thing being measured.
+MAX_STORED_PER_GROUP = 5000
+
+
+class MockGraphiti:
+    """In-memory state and fault injection shared by all request handlers."""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.groups = {}
+        self.counters = {"healthcheck": 0, "messages": 0, "search": 0,
+                         "episodes": 0, "errors": 0}
+
+    def delay(self):
+        """Sleep for the configured latency plus jitter."""
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        seconds = max(0.0, self.latency_ms + jitter) / 1000.0
+        if seconds:
+            time.sleep(seconds)
+
+    def should_fail(self):
+        """Decide whether to inject an error into this request."""
+        if not self.error_rate:
+            return False
+        with self.lock:
+            failed = self.random.random() < self.error_rate
+            if failed:
+                self.counters["errors"] += 1
+        return failed
+
+    def add_messages(self, group_id, messages):
+        with self.lock:
+            self.counters["messages"] += 1
+            self.counters["episodes"] += len(messages)
+            stored = self.groups.setdefault(group_id, deque(maxlen=MAX_STORED_PER_GROUP))
+            for message in messages:
+                stored.append(message)
+
+    def search(self, query, group_ids, max_facts):
+        """Return facts whose content shares a word with the query."""
+        words = set(re.findall(r'\w+', query.lower()))
+        with self.lock:
+            self.counters["search"] += 1
+            groups = group_ids or list(self.groups)
+            candidates = [(g, m) for g in groups for m in reversed(self.groups.get(g, ()))]
+        facts = []
+        for group_id, message in candidates:
+            content = message.get("content", "")
+            if words and not words & set(re.findall(r'\w+', content.lower())):
+                continue
+            facts.append({
+                "uuid": f"{group_id}-{len(facts)}",
+                "name": message.get("role", ""),
+                "fact": content[:200],
+                "valid_at": message.get("timestamp"),
+                "invalid_at": None,
+                "created_at": message.get("timestamp"),
+                "expired_at": None,
+            })
+            if len(facts) >= max_facts:
+                break
+        return facts
+
+    def stats(self):
+        with self.lock:
+            return dict(self.counters)
+
+
+def make_handler(mock):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, keep-alive
+        # clients stall on Nagle + delayed ACK for ~40ms per request.
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, status, body):
+            data = json.dumps(body).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            try:
+                return json.loads(raw or b'{}')
+            except json.JSONDecodeError:
+                return None
+
+        def do_GET(self):
+            if self.path == "/healthcheck":
+                with mock.lock:
+                    mock.counters["healthcheck"] += 1
+                self.send_json(200, {"status": "ok"})
+            elif self.path == "/stats":
+                self.send_json(200, mock.stats())
+            else:
+                self.send_json(404, {"detail": "Not Found"})
+
+        def do_POST(self):
+            body = self.read_json()
+            mock.delay()
+            if body is None:
+                self.send_json(422, {"detail": "Invalid JSON"})
+                return
+            if mock.should_fail():
+                self.send_json(500, {"detail": "Injected failure"})
+                return
+
+            if self.path == "/messages":
+                mock.add_messages(body.get("group_id", ""), body.get("messages", []))
+                self.send_json(202, {"message": "Messages added to processing queue", "success": True})
+            elif self.path == "/search":
+                group_ids = body.get("group_ids") or ([body["group_id"]] if body.get("group_id") else [])
+                facts = mock.search(body.get("query", ""), group_ids, int(body.get("max_facts", 10)))
+                self.send_json(200, {"facts": facts})
+            else:
+                self.send_json(404, {"detail": "Not Found"})
+
+    return Handler
+
+
+def start_server(host="127.0.0.1", port=0, **options):
+    """Start the mock in a background thread. Returns (server, mock, url)."""
+    mock = MockGraphiti(**options)
+    server = ThreadingHTTPServer((host, port), make_handler(mock))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://{host}:{server.server_address[1]}"
+    return server, mock, url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Graphiti stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per POST")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform +/- jitter on latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of POSTs answered with 500")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server, mock, url = start_server(
+        args.host, args.port,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, seed=args.seed,
+    )
+    print(f"Mock Graphiti listening on {url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(json.dumps(mock.stats()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark suite for the Graphiti memory scripts.
+
+Generates a synthetic fixture home (see fixtures.py), starts the local
+Graphiti stand-in (see mock_graphiti.py) and drives the real scripts
+against it: sync_sessions(), the file importer, the file watcher and the
+search/context/log shell helpers. Each scenario runs in a fresh interpreter so
+peak RSS is per scenario, and reports throughput, p50/p99 request latency
+and peak RSS. Results are written as JSON tagged with the git commit so
+runs on different commits can be compared with --baseline.
+
+Usage:
+  run_bench.py [--messages 10000] [--scenarios sessions,import,...]
+               [--latency-ms 0] [--jitter-ms 0] [--error-rate 0.0]
+               [--seed 0] [--output results.json] [--baseline old.json]
+"""
+
+import argparse
+import contextlib
+import http.client
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+SCRIPTS_DIR = REPO_DIR / "scripts"
+
+sys.path.insert(0, str(BENCH_DIR))
+
+SCENARIOS = [
+    "sessions",
+    "import",
+    "watch-cold",
+    "watch-idle",
+    "watch-incremental",
+    "search",
+    "context",
+    "search-daemon",
+    "context-daemon",
+    "log",
+    "log-daemon",
+]
+
+SHELL_SCENARIOS = ("search", "context", "search-daemon", "context-daemon", "log", "log-daemon")
+
+# Seconds a log scenario waits for the spool to reach Graphiti
+LOG_DRAIN_TIMEOUT = 120
+
+SEARCH_QUERIES = ["deploy server", "invoice accountant", "portfolio budget",
+                  "flight calendar", "password rotated", "roadmap feature"]
+
+# Metrics compared against a baseline, and whether higher is better
+COMPARED_METRICS = {
+    "throughput": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "peak_rss_kb": False,
+}
+
+
+def load_script(filename):
+    """Import one of the hyphenated scripts in scripts/ as a module."""
+    path = SCRIPTS_DIR / filename
+    name = path.stem.replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_kb(who=None):
+    """Peak resident set size in KiB (ru_maxrss is bytes on macOS)."""
+    import resource
+    usage = resource.getrusage(resource.RUSAGE_SELF if who is None else who)
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def instrument_http(latencies):
+    """Record request-to-response-headers latency for every http.client call.
+
+    Both urllib.request and direct http.client users go through these two
+    methods, so the timing survives changes to how the scripts talk HTTP.
+    """
+    original_request = http.client.HTTPConnection.request
+    original_getresponse = http.client.HTTPConnection.getresponse
+
+    def request(self, *args, **kwargs):
+        self._bench_started = time.perf_counter()
+        return original_request(self, *args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        response = original_getresponse(self, *args, **kwargs)
+        started = getattr(self, "_bench_started", None)
+        if started is not None:
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            self._bench_started = None
+        return response
+
+    http.client.HTTPConnection.request = request
+    http.client.HTTPConnection.getresponse = getresponse
+
+
+def run_python_scenario(scenario, latencies, options):
+    """Run one in-process scenario against the real scripts."""
+    if scenario == "sessions":
+        load_script("graphiti-sync-sessions.py").sync_sessions()
+    elif scenario == "import":
+        load_script("graphiti-import-files.py").main()
+    elif scenario.startswith("watch-"):
+        if scenario == "watch-incremental":
+            import random
+            from fixtures import touch_memory_tree
+            touch_memory_tree(Path.home(), options["touch_fraction"], random.Random(options["seed"]))
+        load_script("graphiti-watch-files.py").main()
+    else:
+        raise ValueError(f"Unknown scenario: {scenario}")
+    return len(latencies)
+
+
+@contextlib.contextmanager
+def memory_daemon():
+    """Run a graphiti-memory daemon (no scheduled sources) for the scenario."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from graphiti_memory import control
+
+    proc = subprocess.Popen([sys.executable, str(SCRIPTS_DIR / "graphiti-memory.py"), "run",
+                             "--sources", "imports"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 10
+        while not control.is_running():
+            if proc.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError("graphiti-memory daemon did not start")
+            time.sleep(0.05)
+        yield
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def run_shell_scenario(scenario, latencies, options):
+    """Invoke the search/context/log helpers the way an agent tool call does."""
+    if scenario.startswith("log"):
+        return run_log_scenario(scenario, latencies, options)
+    search = scenario.startswith("search")
+    script = SCRIPTS_DIR / ("graphiti-search.sh" if search else "graphiti-context.sh")
+    calls = options["search_calls"]
+    with memory_daemon() if scenario.endswith("-daemon") else contextlib.nullcontext():
+        for i in range(calls):
+            query = SEARCH_QUERIES[i % len(SEARCH_QUERIES)]
+            args = [query, "clawdbot-main"] if search else [query, "main"]
+            started = time.perf_counter()
+            subprocess.run(["bash", str(script)] + args, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=False)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+    return calls
+
+
+def run_log_scenario(scenario, latencies, options):
+    """A burst of graphiti-log.sh calls; latencies are per call, wall time
+    runs until the spool has been delivered to Graphiti."""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from graphiti_memory.spool import Spool
+
+    script = SCRIPTS_DIR / "graphiti-log.sh"
+    calls = options["log_calls"]
+    spool = Spool()
+    with memory_daemon() if scenario.endswith("-daemon") else contextlib.nullcontext():
+        for i in range(calls):
+            started = time.perf_counter()
+            subprocess.run(["bash", str(script), "main", "assistant", "Main",
+                            f"Benchmark discovery {i}: {SEARCH_QUERIES[i % len(SEARCH_QUERIES)]}"],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+        deadline = time.monotonic() + LOG_DRAIN_TIMEOUT
+        while spool.pending_count("clawdbot-main"):
+            if time.monotonic() > deadline:
+                raise SystemExit(f"log spool not drained after {LOG_DRAIN_TIMEOUT}s")
+            time.sleep(0.02)
+    return calls
+
+
+def worker(scenario, result_file, options):
+    """Child process entry point: run a scenario and write its metrics."""
+    latencies = []
+    shell = scenario in SHELL_SCENARIOS
+    if not shell:
+        instrument_http(latencies)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            requests = (run_shell_scenario if shell else run_python_scenario)(scenario, latencies, options)
+            error = None
+        except SystemExit as e:
+            requests, error = len(latencies), f"exited with {e.code}"
+    elapsed = time.perf_counter() - started
+
+    import resource
+    result = {
+        "wall_s": round(elapsed, 4),
+        "requests": requests,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "peak_rss_kb": peak_rss_kb(resource.RUSAGE_CHILDREN if shell else None),
+        "error": error,
+    }
+    Path(result_file).write_text(json.dumps(result))
+
+
+def git_revision():
+    """Short commit hash of the tree under test, marked if dirty."""
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               cwd=REPO_DIR, capture_output=True, text=True).stdout.strip()
+        return rev + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def get_stats(url):
+    """Fetch the stand-in's request counters."""
+    with urllib.request.urlopen(f"{url}/stats", timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def run_scenario(scenario, home, url, mock_before, options):
+    """Run a scenario in a fresh interpreter and merge in server-side counts."""
+    env = dict(os.environ)
+    env.update({
+        "HOME": str(home),
+        "GRAPHITI_URL": url,
+        "GRAPHITI_SYNC_MAX_MESSAGES": str(options["messages"]),
+        "GRAPHITI_RATE_LIMIT_DELAY": "0",
+    })
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+        result_file = tmp.name
+    try:
+        subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), "--worker", scenario,
+             "--result-file", result_file, "--options", json.dumps(options)],
+            env=env, check=True,
+        )
+        result = json.loads(Path(result_file).read_text())
+    finally:
+        os.unlink(result_file)
+
+    mock_after = get_stats(url)
+    result["episodes"] = mock_after["episodes"] - mock_before["episodes"]
+    result["server_errors"] = mock_after["errors"] - mock_before["errors"]
+    # Ingestion scenarios are measured in episodes delivered, search in calls
+    items = result["requests"] if scenario in SHELL_SCENARIOS else result["episodes"]
+    result["items"] = items
+    result["throughput"] = round(items / result["wall_s"], 2) if result["wall_s"] else None
+    return result, mock_after
+
+
+def compare(results, baseline):
+    """Print per-scenario deltas against a previous results file."""
+    print(f"\nComparison vs baseline {baseline.get('commit')} ({baseline.get('timestamp')}):")
+    if baseline.get("params") != results.get("params"):
+        print("  warning: benchmark parameters differ from baseline")
+    print(f"  {'scenario':<18} {'metric':<12} {'baseline':>12} {'current':>12} {'delta':>9}")
+    for scenario, current in results["results"].items():
+        previous = baseline.get("results", {}).get(scenario)
+        if not previous:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), current.get(metric)
+            if old in (None, 0) or new is None:
+                continue
+            delta = (new - old) / old * 100.0
+            better = delta > 0 if higher_is_better else delta < 0
+            marker = "+" if better else ("-" if delta else " ")
+            print(f"  {scenario:<18} {metric:<12} {old:>12.2f} {new:>12.2f} {delta:>8.1f}% {marker}")
+
+
+def print_results(results):
+    print(f"\nGraphiti benchmark @ {results['commit']} ({results['params']['messages']} messages)")
+    print(f"  {'scenario':<18} {'items':>8} {'wall s':>9} {'items/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'peak RSS KiB':>13}")
+    for scenario, r in results["results"].items():
+        fmt = lambda v: f"{v:.2f}" if isinstance(v, float) else str(v if v is not None else "-")
+        print(f"  {scenario:<18} {r['items']:>8} {r['wall_s']:>9.3f} {fmt(r['throughput']):>10} "
+              f"{fmt(r['p50_ms']):>8} {fmt(r['p99_ms']):>8} {r['peak_rss_kb']:>13}")
+        if r.get("error"):
+            print(f"  {'':<18} error: {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Graphiti memory scripts against a local stand-in")
+    parser.add_argument("--messages", type=int, default=10000, help="Synthetic session messages (10k-1M)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--search-calls", type=int, default=50)
+    parser.add_argument("--log-calls", type=int, default=50)
+    parser.add_argument("--touch-fraction", type=float, default=0.05,
+                        help="Fraction of daily logs modified before watch-incremental")
+    parser.add_argument("--workdir", help="Fixture directory (default: temporary, removed afterwards)")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against a previous results JSON")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    parser.add_argument("--options", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.result_file, json.loads(args.options))
+        return
+
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    from fixtures import generate
+    from mock_graphiti import start_server
+
+    options = {
+        "messages": args.messages,
+        "seed": args.seed,
+        "search_calls": args.search_calls,
+        "log_calls": args.log_calls,
+        "touch_fraction": args.touch_fraction,
+    }
+    params = dict(options, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                  error_rate=args.error_rate)
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix="graphiti-bench-"))
+    home = workdir / "home"
+    if home.exists():
+        shutil.rmtree(home)
+
+    print(f"Generating fixtures for {args.messages} messages in {home}...", file=sys.stderr)
+    started = time.perf_counter()
+    fixture_summary = generate(home, args.messages, args.seed)
+    print(f"  done in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    server, mock, url = start_server(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                                     error_rate=args.error_rate, seed=args.seed)
+    results = {
+        "commit": git_revision(),
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "fixtures": fixture_summary,
+        "results": {},
+    }
+    try:
+        stats = get_stats(url)
+        for scenario in scenarios:
+            print(f"Running {scenario}...", file=sys.stderr)
+            results["results"][scenario], stats = run_scenario(scenario, home, url, stats, options)
+    finally:
+        server.shutdown()
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nResults written to {args.output}")
+    if args.baseline:
+        compare(results, json.loads(Path(args.baseline).read_text()))
+
+
+if __name__ == "__main__":
+    main()
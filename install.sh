@@ -139,9 +139,25 @@ download_scripts() {
     local scripts=(
         "graphiti-search.sh"
         "graphiti-log.sh"
+        "graphiti-context.sh"
+        "graphiti-cli.py"
+        "graphiti-memory.py"
         "graphiti-sync-sessions.py"
         "graphiti-watch-files.py"
         "graphiti-import-files.py"
+        "graphiti_memory/__init__.py"
+        "graphiti_memory/cache.py"
+        "graphiti_memory/client.py"
+        "graphiti_memory/control.py"
+        "graphiti_memory/daemon.py"
+        "graphiti_memory/render.py"
+        "graphiti_memory/scheduler.py"
+        "graphiti_memory/spool.py"
+        "graphiti_memory/state.py"
+        "graphiti_memory/sources/__init__.py"
+        "graphiti_memory/sources/files.py"
+        "graphiti_memory/sources/imports.py"
+        "graphiti_memory/sources/sessions.py"
         "memory-hybrid-search.sh"
         "memory-status.sh"
     )
@@ -153,6 +169,7 @@ download_scripts() {
         if [ "$DRY_RUN" = true ]; then
             echo "  [DRY-RUN] Download $script → $dest"
         else
+            mkdir -p "$(dirname "$dest")"
             if curl -fsSL "$url" -o "$dest" 2>/dev/null; then
                 chmod +x "$dest" 2>/dev/null || true
                 echo "  Downloaded: $script"
@@ -211,68 +228,54 @@ configure_launchd() {
     
     echo "⚙️  Configuring LaunchAgents..."
     
-    # File sync agent
-    cat > /tmp/com.clawd.graphiti-file-sync.plist <<EOF
+    # Single resident daemon for session sync, file watching and imports
+    cat > /tmp/com.clawd.graphiti-memory.plist <<EOF
 <?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>Label</key>
-    <string>com.clawd.graphiti-file-sync</string>
+    <string>com.clawd.graphiti-memory</string>
     <key>ProgramArguments</key>
     <array>
         <string>/usr/bin/python3</string>
-        <string>$SCRIPT_DIR/graphiti-watch-files.py</string>
+        <string>-u</string>
+        <string>$SCRIPT_DIR/graphiti-memory.py</string>
+        <string>run</string>
     </array>
-    <key>StartInterval</key>
-    <integer>600</integer>
+    <key>RunAtLoad</key>
+    <true/>
+    <key>KeepAlive</key>
+    <true/>
     <key>StandardOutPath</key>
-    <string>$HOME/.clawdbot/logs/graphiti-file-sync.log</string>
+    <string>$HOME/.clawdbot/logs/graphiti-memory.log</string>
     <key>StandardErrorPath</key>
-    <string>$HOME/.clawdbot/logs/graphiti-file-sync.log</string>
-</dict>
-</plist>
-EOF
-    
-    # Session sync agent
-    cat > /tmp/com.clawd.graphiti-sync.plist <<EOF
-<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.clawd.graphiti-sync</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>/usr/bin/python3</string>
-        <string>$SCRIPT_DIR/graphiti-sync-sessions.py</string>
-    </array>
-    <key>StartInterval</key>
-    <integer>1800</integer>
-    <key>StandardOutPath</key>
-    <string>$HOME/.clawdbot/logs/graphiti-sync.log</string>
-    <key>StandardErrorPath</key>
-    <string>$HOME/.clawdbot/logs/graphiti-sync.log</string>
+    <string>$HOME/.clawdbot/logs/graphiti-memory.log</string>
 </dict>
 </plist>
 EOF
     
     if [ "$DRY_RUN" = true ]; then
-        echo "  [DRY-RUN] Copy LaunchAgents to $LAUNCHAGENTS_DIR"
-        echo "  [DRY-RUN] launchctl load agents"
+        echo "  [DRY-RUN] Copy LaunchAgent to $LAUNCHAGENTS_DIR"
+        echo "  [DRY-RUN] launchctl load agent"
     else
-        cp /tmp/com.clawd.graphiti-file-sync.plist "$LAUNCHAGENTS_DIR/"
-        cp /tmp/com.clawd.graphiti-sync.plist "$LAUNCHAGENTS_DIR/"
+        # Retire the interval-launched agents the daemon replaces
+        for old in com.clawd.graphiti-file-sync com.clawd.graphiti-sync; do
+            if [ -f "${LAUNCHAGENTS_DIR:?}/${old:?}.plist" ]; then
+                launchctl unload "${LAUNCHAGENTS_DIR:?}/${old:?}.plist" 2>/dev/null || true
+                rm -f "${LAUNCHAGENTS_DIR:?}/${old:?}.plist"
+            fi
+        done
+        
+        cp /tmp/com.clawd.graphiti-memory.plist "$LAUNCHAGENTS_DIR/"
         
         # Unload if already loaded
-        launchctl unload "$LAUNCHAGENTS_DIR/com.clawd.graphiti-file-sync.plist" 2>/dev/null || true
-        launchctl unload "$LAUNCHAGENTS_DIR/com.clawd.graphiti-sync.plist" 2>/dev/null || true
+        launchctl unload "$LAUNCHAGENTS_DIR/com.clawd.graphiti-memory.plist" 2>/dev/null || true
         
-        # Load agents
-        launchctl load "$LAUNCHAGENTS_DIR/com.clawd.graphiti-file-sync.plist" 2>/dev/null || true
-        launchctl load "$LAUNCHAGENTS_DIR/com.clawd.graphiti-sync.plist" 2>/dev/null || true
+        # Load agent
+        launchctl load "$LAUNCHAGENTS_DIR/com.clawd.graphiti-memory.plist" 2>/dev/null || true
         
-        log_step "LaunchAgents configured and loaded"
+        log_step "graphiti-memory LaunchAgent configured and loaded"
     fi
     
     echo ""
@@ -382,6 +385,7 @@ print_summary() {
     echo "Quick commands:"
     echo "  ~/clawd/scripts/memory-hybrid-search.sh \"your query\""
     echo "  ~/clawd/scripts/memory-status.sh"
+    echo "  ~/clawd/scripts/graphiti-memory.py status"
     echo "  ~/clawd/scripts/graphiti-log.sh clawdbot-main user \"Name\" \"Fact\""
     echo ""
     echo "Services:"
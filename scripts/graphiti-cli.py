@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Graphiti client for agents: search, log and context in one process.
+
+Talks to the graphiti-memory daemon over its Unix socket when it is
+running (pooled keep-alive connections and a search cache), otherwise to
+Graphiti directly. Replaces the bash + curl + jq pipelines behind
+graphiti-search.sh, graphiti-log.sh and graphiti-context.sh, which are now
+thin wrappers around this script. Needs the graphiti_memory package next
+to it.
+
+log does not wait for Graphiti: messages are appended to a per-group
+spool (~/.clawdbot/graphiti-spool/) and sent in batches by the daemon, or
+by a background "graphiti-cli.py flush-spool" process when no daemon is
+running. log --sync waits until Graphiti has accepted the message.
+Searches include spooled messages, marked pending.
+
+Usage:
+  graphiti-cli.py search "query" [group_id] [max_facts]
+  graphiti-cli.py log [--sync] <agent_id> <role_type> <role> <content> [timestamp]
+  graphiti-cli.py context "task description" [agent_id]
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from graphiti_memory import control, render  # noqa: E402
+from graphiti_memory.client import GraphitiClient, GraphitiError  # noqa: E402
+from graphiti_memory.spool import LINGER, ROLE_TYPES, Spool, locked, merge_facts  # noqa: E402
+
+TIMEOUT = 30
+# Background flush-spool retries while Graphiti is down: first delay,
+# longest delay, and how long before it leaves the rest to the next log call
+FLUSH_RETRY_FIRST = 5
+FLUSH_RETRY_MAX = 300
+FLUSH_GIVE_UP = 3600
+
+USAGE = {
+    "search": 'Usage: graphiti-search.sh "query" [group_id] [max_facts]',
+    "log": "Usage: graphiti-log.sh [--sync] <agent_id> <user|assistant|system> <role> <content> [timestamp]",
+    "context": 'Usage: graphiti-context.sh "task description" [agent_id]',
+}
+
+
+def daemon_request(command, **args):
+    """Send one command to the daemon and return its response, or None if
+    no daemon is running.
+
+    Once the request is sent the daemon may have acted on it (e.g. spooled
+    a log message), so a missing answer is an error, never a reason to
+    redo the request directly.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(TIMEOUT + 5)
+    try:
+        try:
+            sock.connect(control.SOCKET_PATH)
+        except OSError:
+            return None
+        chunks = []
+        try:
+            sock.sendall(json.dumps(dict(args, command=command)).encode('utf-8') + b"\n")
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        except OSError as e:
+            raise GraphitiError(f"graphiti-memory daemon did not answer ({e or 'timed out'})") from e
+    finally:
+        sock.close()
+
+    try:
+        response = json.loads(b"".join(chunks))
+    except ValueError:
+        raise GraphitiError("graphiti-memory daemon did not answer") from None
+    if not response.get("ok"):
+        raise GraphitiError(response.get("error") or "graphiti-memory daemon failed")
+    return response
+
+
+def search_direct(client, search):
+    """Run one search payload against Graphiti."""
+    try:
+        return client.search(search["query"], search.get("group_ids"), search["max_facts"])
+    except OSError as e:
+        raise GraphitiError(f"{client.base_url}: {e}") from e
+
+
+def with_local(query, group_ids, max_facts, facts, own_group=None):
+    """Merge in spooled messages matching query, so an agent finds what it just logged."""
+    local = Spool().local_facts(query, group_ids, max_facts, own_group)
+    return merge_facts(local, facts, max_facts)
+
+
+def start_flusher(group_id):
+    """Start a detached flush-spool process unless one is already running for the group."""
+    spool = Spool()
+    with locked(spool.paths(group_id)["flusher_lock"], blocking=False) as free:
+        if not free:
+            # The running flusher re-checks the spool before it exits
+            return
+
+    sys.stdout.flush()
+    if os.fork():
+        return
+    try:
+        os.setsid()
+        null = os.open(os.devnull, os.O_RDWR)
+        log = os.open(spool.dir / "flush.log", os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        os.dup2(null, 0)
+        os.dup2(null, 1)
+        os.dup2(log, 2)
+        os.execv(sys.executable, [sys.executable, os.path.realpath(__file__), "flush-spool", group_id])
+    finally:
+        os._exit(1)
+
+
+def search_payload(query, group_id=None, max_facts=10):
+    payload = {"query": query, "max_facts": max_facts}
+    if group_id:
+        payload["group_ids"] = [group_id]
+    return payload
+
+
+def cmd_search(args):
+    if not args:
+        print(f"graphiti-cli.py: {USAGE['search']}", file=sys.stderr)
+        return 1
+    query = args[0]
+    group_id = args[1] if len(args) > 1 else ""
+    try:
+        max_facts = int(args[2]) if len(args) > 2 else 10
+    except ValueError:
+        max_facts = 0
+    if max_facts < 1:
+        print(f"graphiti-cli.py: max_facts must be a positive number\n{USAGE['search']}", file=sys.stderr)
+        return 1
+    search = search_payload(query, group_id, max_facts)
+    # Searching one group is how an agent reads back its own writes
+    own_group = group_id or None
+
+    response = daemon_request("search", searches=[search], own_group=own_group)
+    if response is not None:
+        result = response["results"][0]
+        if "error" in result:
+            raise GraphitiError(result["error"])
+        facts = result["facts"]
+    else:
+        client = GraphitiClient(timeout=TIMEOUT)
+        try:
+            facts = search_direct(client, search)
+        finally:
+            client.close()
+        facts = with_local(query, search.get("group_ids"), max_facts, facts, own_group)
+    sys.stdout.write(render.render_search(query, facts))
+    return 0
+
+
+def cmd_log(args):
+    sync = bool(args) and args[0] == "--sync"
+    if sync:
+        args = args[1:]
+    if len(args) < 4:
+        print(f"graphiti-cli.py: {USAGE['log']}", file=sys.stderr)
+        return 1
+    agent_id, role_type, role, content = args[:4]
+    if role_type not in ROLE_TYPES:
+        print(f"graphiti-cli.py: role_type must be one of {', '.join(ROLE_TYPES)}\n{USAGE['log']}", file=sys.stderr)
+        return 1
+    timestamp = args[4] if len(args) > 4 else time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+    group_id = f"clawdbot-{agent_id}"
+    messages = [{"role_type": role_type, "role": role, "content": content, "timestamp": timestamp}]
+
+    response = daemon_request("log", group_id=group_id, messages=messages, sync=sync)
+    if response is not None:
+        text = f"Queued to {group_id}\n" if response.get("queued") else render.render_log(response.get("response"))
+    else:
+        try:
+            Spool().append(group_id, messages)
+        except ValueError as e:
+            raise GraphitiError(str(e)) from e
+        if sync:
+            text = render.render_log(log_sync(group_id))
+        else:
+            # Every group with anything pending, so entries a flusher gave
+            # up on during an outage go out with the next log call
+            for pending in set(Spool().groups()) | {group_id}:
+                start_flusher(pending)
+            text = f"Queued to {group_id}\n"
+    sys.stdout.write(text)
+    return 0
+
+
+def log_sync(group_id):
+    """Flush the group now, so earlier queued messages go first. Returns
+    Graphiti's last response."""
+    log_spool = Spool()
+    client = GraphitiClient(timeout=TIMEOUT)
+    try:
+        _, rejected, error, response = log_spool.flush_group(client, group_id)
+    finally:
+        client.close()
+    if error:
+        raise GraphitiError(f"{error} (message kept in the log spool)")
+    if rejected:
+        raise GraphitiError(log_spool.rejected_error(group_id, rejected))
+    return response
+
+
+def cmd_flush_spool(args):
+    """Send one group's spool to Graphiti; started in the background by log."""
+    if not args:
+        print("Usage: graphiti-cli.py flush-spool <group_id>", file=sys.stderr)
+        return 2
+    group_id = args[0]
+    log_spool = Spool()
+    client = GraphitiClient(timeout=TIMEOUT)
+    try:
+        while True:
+            with locked(log_spool.paths(group_id)["flusher_lock"], blocking=False) as acquired:
+                if not acquired:
+                    return 0
+                rc = flush_with_retry(log_spool, client, group_id)
+            # A log call that raced our exit saw the lock held and left its
+            # entries to us
+            if rc or not log_spool.pending_count(group_id):
+                return rc
+    finally:
+        client.close()
+
+
+def flush_with_retry(log_spool, client, group_id):
+    """Flush the group, retrying with backoff while Graphiti fails, for up
+    to FLUSH_GIVE_UP seconds. Progress goes to flush.log."""
+    delay = FLUSH_RETRY_FIRST
+    give_up = time.monotonic() + FLUSH_GIVE_UP
+    linger = LINGER
+    while True:
+        sent, _, error, _ = log_spool.flush_group(client, group_id, wait=False, linger=linger)
+        if not error:
+            return 0
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        if time.monotonic() + delay > give_up:
+            print(f"{stamp} {group_id}: {error} ({sent} sent, giving up; the rest goes with the next log call)",
+                  file=sys.stderr, flush=True)
+            return 1
+        print(f"{stamp} {group_id}: {error} ({sent} sent, retrying in {delay}s)", file=sys.stderr, flush=True)
+        time.sleep(delay)
+        delay, linger = min(delay * 2, FLUSH_RETRY_MAX), 0
+
+
+def cmd_context(args):
+    if not args:
+        print(f"graphiti-cli.py: {USAGE['context']}", file=sys.stderr)
+        return 1
+    task = args[0]
+    agent_id = args[1] if len(args) > 1 else ""
+
+    sections = [
+        ("Cross-Agent Knowledge", search_payload(task, None, 10)),
+        ("User Context", search_payload(task, "user-main", 5)),
+        ("System Context", search_payload(task, "system-shared", 5)),
+    ]
+    if agent_id:
+        sections.append((f"My Memory ({agent_id})", search_payload(task, f"clawdbot-{agent_id}", 5)))
+    titles = [title for title, _ in sections]
+    searches = [search for _, search in sections]
+    own_group = f"clawdbot-{agent_id}" if agent_id else None
+
+    # One error per failed section; the others still print
+    errors = []
+    response = daemon_request("search", searches=searches, own_group=own_group)
+    if response is not None:
+        results = []
+        for title, result in zip(titles, response["results"]):
+            if "error" in result:
+                errors.append(f"{title}: {result['error']}")
+            results.append(result.get("facts"))
+    else:
+        client = GraphitiClient(timeout=TIMEOUT)
+        results = []
+        try:
+            for title, search in sections:
+                try:
+                    facts = search_direct(client, search)
+                except GraphitiError as e:
+                    errors.append(f"{title}: {e}")
+                    results.append(None)
+                    continue
+                results.append(with_local(task, search.get("group_ids"), search["max_facts"], facts, own_group))
+        finally:
+            client.close()
+    for error in errors:
+        print(f"Error: {error}", file=sys.stderr)
+    sys.stdout.write(render.render_context(titles, results))
+    return 1 if len(errors) == len(sections) else 0
+
+
+COMMANDS = {"search": cmd_search, "log": cmd_log, "context": cmd_context, "flush-spool": cmd_flush_spool}
+
+
+def main(argv):
+    if not argv or argv[0] not in COMMANDS:
+        print("Usage: graphiti-cli.py {search|log|context} ...", file=sys.stderr)
+        for usage in USAGE.values():
+            print(f"  {usage}", file=sys.stderr)
+        return 2
+    try:
+        return COMMANDS[argv[0]](argv[1:])
+    except GraphitiError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
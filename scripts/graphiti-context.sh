@@ -2,46 +2,19 @@
 # Get relevant shared memory context for a task
 # Usage: graphiti-context.sh "task description" [agent_id]
 # Searches cross-group + agent's own group for comprehensive context
-set -euo pipefail
-
-GRAPHITI_URL="${GRAPHITI_URL:-http://localhost:8001}"
-TASK="${1:?Usage: graphiti-context.sh \"task description\" [agent_id]}"
-AGENT_ID="${2:-}"
-
-echo "=== Shared Memory Context ==="
-echo ""
-
-# 1. Cross-group search (all agents' knowledge)
-echo "--- Cross-Agent Knowledge ---"
-PAYLOAD=$(jq -n --arg q "$TASK" '{query: $q, max_facts: 10}')
-curl -s -X POST "${GRAPHITI_URL}/search" \
-  -H 'Content-Type: application/json' \
-  -d "$PAYLOAD" | jq -r '.facts[]? | "• \(.fact)"' 2>/dev/null
-
-echo ""
-
-# 2. User context (user's profile/preferences)
-echo "--- User Context ---"
-PAYLOAD=$(jq -n --arg q "$TASK" --arg g "user-main" '{query: $q, group_id: $g, max_facts: 5}')
-curl -s -X POST "${GRAPHITI_URL}/search" \
-  -H 'Content-Type: application/json' \
-  -d "$PAYLOAD" | jq -r '.facts[]? | "• \(.fact)"' 2>/dev/null
-
-echo ""
-
-# 3. System shared context
-echo "--- System Context ---"
-PAYLOAD=$(jq -n --arg q "$TASK" --arg g "system-shared" '{query: $q, group_id: $g, max_facts: 5}')
-curl -s -X POST "${GRAPHITI_URL}/search" \
-  -H 'Content-Type: application/json' \
-  -d "$PAYLOAD" | jq -r '.facts[]? | "• \(.fact)"' 2>/dev/null
-
-# 4. Agent's own memory (if agent_id provided)
-if [ -n "$AGENT_ID" ]; then
-  echo ""
-  echo "--- My Memory (${AGENT_ID}) ---"
-  PAYLOAD=$(jq -n --arg q "$TASK" --arg g "clawdbot-${AGENT_ID}" '{query: $q, group_id: $g, max_facts: 5}')
-  curl -s -X POST "${GRAPHITI_URL}/search" \
-    -H 'Content-Type: application/json' \
-    -d "$PAYLOAD" | jq -r '.facts[]? | "• \(.fact)"' 2>/dev/null
+# Thin wrapper around graphiti-cli.py (call it directly to skip bash)
+# Find graphiti-cli.py next to the real file, following symlinks
+src="${BASH_SOURCE[0]}"
+while [ -L "$src" ]; do
+    link="$(readlink "$src")"
+    case "$link" in
+        /*) src="$link" ;;
+        *) src="$(dirname "$src")/$link" ;;
+    esac
+done
+cli="$(dirname "$src")/graphiti-cli.py"
+if [ ! -f "$cli" ]; then
+    echo "Error: $cli not found; install graphiti-cli.py (and graphiti_memory/) next to $(basename "$src")" >&2
+    exit 1
 fi
+exec python3 "$cli" context "$@"
@@ -1,34 +1,20 @@
 #!/usr/bin/env bash
 # Shared Graphiti logger for all agents
-# Usage: graphiti-log.sh <agent_id> <role_type> <role> <content> [timestamp]
+# Usage: graphiti-log.sh [--sync] <agent_id> <role_type> <role> <content> [timestamp]
 # Agents should ONLY log to their own group: clawdbot-<agent_id>
-set -euo pipefail
-
-GRAPHITI_URL="${GRAPHITI_URL:-http://localhost:8001}"
-AGENT_ID="${1:?Usage: graphiti-log.sh <agent_id> <role_type> <role> <content> [timestamp]}"
-ROLE_TYPE="${2:?Missing role_type (user|assistant|system)}"
-ROLE="${3:?Missing role (speaker name)}"
-CONTENT="${4:?Missing content}"
-TIMESTAMP="${5:-$(date -u +%Y-%m-%dT%H:%M:%S+00:00)}"
-
-GROUP_ID="clawdbot-${AGENT_ID}"
-
-PAYLOAD=$(jq -n \
-  --arg g "$GROUP_ID" \
-  --arg rt "$ROLE_TYPE" \
-  --arg r "$ROLE" \
-  --arg c "$CONTENT" \
-  --arg t "$TIMESTAMP" \
-  '{
-    group_id: $g,
-    messages: [{
-      role_type: $rt,
-      role: $r,
-      content: $c,
-      timestamp: $t
-    }]
-  }')
-
-curl -s -X POST "${GRAPHITI_URL}/messages" \
-  -H 'Content-Type: application/json' \
-  -d "$PAYLOAD" | jq -r '.result // .message // "Logged successfully"' 2>/dev/null || echo "Logged to ${GROUP_ID}"
+# Thin wrapper around graphiti-cli.py (call it directly to skip bash)
+# Find graphiti-cli.py next to the real file, following symlinks
+src="${BASH_SOURCE[0]}"
+while [ -L "$src" ]; do
+    link="$(readlink "$src")"
+    case "$link" in
+        /*) src="$link" ;;
+        *) src="$(dirname "$src")/$link" ;;
+    esac
+done
+cli="$(dirname "$src")/graphiti-cli.py"
+if [ ! -f "$cli" ]; then
+    echo "Error: $cli not found; install graphiti-cli.py (and graphiti_memory/) next to $(basename "$src")" >&2
+    exit 1
+fi
+exec python3 "$cli" log "$@"
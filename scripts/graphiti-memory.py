@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+graphiti-memory: one resident daemon for session sync, file watching and
+file imports, plus a client for its control socket.
+
+Usage:
+  graphiti-memory.py run [--sources sessions,files,imports]
+  graphiti-memory.py status [--json]
+  graphiti-memory.py flush | pause | resume
+  graphiti-memory.py resync [source] [--wait]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from graphiti_memory import control  # noqa: E402
+
+
+def print_status(status):
+    print(f"graphiti-memory pid {status['pid']}, up {status['uptime']}s"
+          f"{' (paused)' if status['paused'] else ''}")
+    print(f"Graphiti {status['graphiti_url']}: {'healthy' if status['graphiti_healthy'] else 'NOT responding'}")
+    for name, info in status["sources"].items():
+        when = "on demand" if info["next_run_in"] is None else f"next in {info['next_run_in']}s"
+        line = f"  {name:<10} runs={info['runs']} last={info['last_run'] or 'never'} result={info['last_result']} ({when})"
+        print(line)
+        if info["last_error"]:
+            print(f"  {'':<10} error: {info['last_error']}")
+    for group, pending in status.get("log_spool", {}).items():
+        error = status.get("log_spool_errors", {}).get(group)
+        print(f"Log spool {group}: {pending} pending{f' (last error: {error})' if error else ''}")
+    for group, rejected in status.get("log_spool_rejected", {}).items():
+        print(f"Log spool {group}: {rejected} rejected by Graphiti (see graphiti-spool/{group}.rejected.jsonl)")
+    if status["dirty_state"]:
+        print(f"Unsaved state: {', '.join(status['dirty_state'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Graphiti memory sync daemon")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the daemon in the foreground")
+    run.add_argument("--sources", help="Comma-separated sources (default: sessions,files,imports)")
+
+    status = sub.add_parser("status", help="Show daemon and source status")
+    status.add_argument("--json", action="store_true")
+
+    sub.add_parser("flush", help="Write pending state to disk and send the log spool")
+    sub.add_parser("pause", help="Pause scheduled and triggered runs")
+    sub.add_parser("resume", help="Resume runs")
+
+    resync = sub.add_parser("resync", help="Run a source (or all scheduled ones) now")
+    resync.add_argument("source", nargs="?")
+    resync.add_argument("--wait", action="store_true", help="Wait for the run to finish")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        from graphiti_memory.daemon import Daemon
+        sources = [s.strip() for s in args.sources.split(",")] if args.sources else None
+        try:
+            Daemon(sources).run()
+        except (ValueError, RuntimeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    request = {}
+    if args.command == "resync":
+        request = {"source": args.source, "wait": args.wait}
+    try:
+        response = control.send(args.command, timeout=None if request.get("wait") else 10, **request)
+    except control.DaemonNotRunning:
+        print("graphiti-memory daemon is not running", file=sys.stderr)
+        sys.exit(1)
+    except OSError as e:
+        # socket.timeout included: flush waits for the scheduler thread,
+        # which may be in the middle of a long source run
+        print(f"graphiti-memory daemon busy, no answer: {e or 'timed out'}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "status" and not args.json and response.get("ok"):
+        print_status(response)
+    else:
+        print(json.dumps(response, indent=2))
+    if not response.get("ok"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
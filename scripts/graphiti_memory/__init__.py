@@ -0,0 +1,15 @@
+"""
+Shared runtime for the Graphiti memory scripts.
+
+Holds the pieces the session sync, file watcher and file importer have in
+common (HTTP client, state store, source modules) so they can run either
+as one-shot scripts or inside the resident graphiti-memory daemon.
+"""
+
+import os
+from pathlib import Path
+
+GRAPHITI_URL = os.environ.get("GRAPHITI_URL", "http://localhost:8001")
+STATE_DIR = Path.home() / ".clawdbot"
+MEMORY_DIR = Path.home() / "clawd/memory"
+CLAWD_DIR = Path.home() / "clawd"
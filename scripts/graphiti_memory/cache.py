@@ -0,0 +1,60 @@
+"""
+Short-lived search result cache for the daemon.
+
+Agents tend to repeat the same context searches at the start of every
+task. Entries expire after a few seconds and are dropped as soon as
+logged messages for a group they cover reach Graphiti. Messages still in
+the log spool are merged into every answer separately, so a cached answer
+never hides the agent's own last write.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+
+SEARCH_CACHE_TTL = 30
+SEARCH_CACHE_SIZE = 256
+
+
+class SearchCache:
+    def __init__(self, ttl=SEARCH_CACHE_TTL, size=SEARCH_CACHE_SIZE):
+        self.ttl = ttl
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(query, group_ids, max_facts):
+        return json.dumps([query, sorted(group_ids or []), max_facts])
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key, group_ids, facts):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), set(group_ids or []), facts)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, group_id):
+        """Drop entries that searched group_id, including all-group searches."""
+        with self._lock:
+            stale = [k for k, (_, groups, _) in self._entries.items() if not groups or group_id in groups]
+            for k in stale:
+                del self._entries[k]
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
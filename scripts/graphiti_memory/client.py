@@ -0,0 +1,146 @@
+"""
+Persistent HTTP client for the Graphiti REST API.
+
+Callers share a small pool of keep-alive connections instead of opening a
+new urllib connection per message. Each request takes its own connection
+for the round trip, so a search from one thread never waits behind a bulk
+import or another search running in a different one.
+"""
+
+import http.client
+import json
+import socket
+import threading
+import time
+import urllib.parse
+
+from . import GRAPHITI_URL
+
+# How long a healthcheck result is trusted before asking Graphiti again
+HEALTH_TTL = 30
+# Idle keep-alive connections kept for reuse; busier moments open more
+POOL_SIZE = 4
+
+# Errors that mean a kept-alive connection went stale before we used it
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class GraphitiError(Exception):
+    """Graphiti answered with a non-success status."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def rejected(self):
+        """Graphiti refused the request itself; sending it again won't help."""
+        return self.status is not None and 400 <= self.status < 500 and self.status not in (408, 429)
+
+
+class GraphitiClient:
+    """Thread-safe Graphiti client reusing pooled HTTP connections."""
+
+    def __init__(self, base_url=GRAPHITI_URL, timeout=30, pool_size=POOL_SIZE):
+        parts = urllib.parse.urlsplit(base_url)
+        self.base_url = base_url
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.https = parts.scheme == "https"
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._idle = []
+        self._lock = threading.Lock()
+        self._health = (0.0, False)
+
+    def _checkout(self):
+        """An idle connection, or a new one. Returns (conn, reused)."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout), False
+
+    def _checkin(self, conn):
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def request(self, method, path, payload=None, timeout=None):
+        """Send a request and return (status, decoded JSON body or None)."""
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        for attempt in (1, 2):
+            conn, reused = self._checkout()
+            try:
+                if conn.sock is None:
+                    conn.connect()
+                    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                conn.sock.settimeout(timeout or self.timeout)
+                conn.request(method, self.prefix + path, body=body, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                # Only a reused connection may have been closed by the
+                # server while idle; a fresh one failing is a real error.
+                if reused and attempt == 1:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.getheader('Connection', '').lower() == 'close':
+                conn.close()
+            else:
+                self._checkin(conn)
+            try:
+                data = json.loads(raw) if raw else None
+            except ValueError:
+                data = None
+            return resp.status, data
+
+    def healthcheck(self, max_age=HEALTH_TTL):
+        """Check if Graphiti is available, caching the answer for max_age seconds."""
+        checked_at, healthy = self._health
+        if max_age and time.monotonic() - checked_at < max_age:
+            return healthy
+        try:
+            status, _ = self.request("GET", "/healthcheck", timeout=5)
+            healthy = status == 200
+        except Exception:
+            healthy = False
+        self._health = (time.monotonic(), healthy)
+        return healthy
+
+    def add_messages(self, group_id, messages, timeout=None):
+        """Queue messages for ingestion. Raises GraphitiError on rejection."""
+        status, data = self.request("POST", "/messages",
+                                    {"group_id": group_id, "messages": messages}, timeout)
+        if status not in (200, 202):
+            raise GraphitiError(f"HTTP {status}: {data}", status)
+        return data
+
+    def search(self, query, group_ids=None, max_facts=10, timeout=None):
+        """Search facts across all groups, or only the given ones."""
+        payload = {"query": query, "max_facts": max_facts}
+        if group_ids:
+            payload["group_ids"] = list(group_ids)
+        status, data = self.request("POST", "/search", payload, timeout)
+        if status != 200:
+            raise GraphitiError(f"HTTP {status}: {data}", status)
+        return (data or {}).get("facts") or []
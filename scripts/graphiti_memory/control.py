@@ -0,0 +1,51 @@
+"""
+Client side of the graphiti-memory daemon's Unix-socket control API.
+
+The protocol is one JSON object per line in each direction:
+  -> {"command": "status"}
+  <- {"ok": true, ...}
+"""
+
+import json
+import os
+import socket
+
+from . import STATE_DIR
+
+SOCKET_PATH = os.environ.get("GRAPHITI_MEMORY_SOCKET", str(STATE_DIR / "graphiti-memory.sock"))
+
+
+class DaemonNotRunning(Exception):
+    """No daemon is listening on the control socket."""
+
+
+def send(command, timeout=5, socket_path=SOCKET_PATH, **args):
+    """Send one command to the daemon and return its decoded response."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise DaemonNotRunning(str(e)) from e
+        sock.sendall(json.dumps(dict(args, command=command)).encode('utf-8') + b"\n")
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    finally:
+        sock.close()
+    if not chunks:
+        raise DaemonNotRunning("daemon closed the connection without answering")
+    return json.loads(b"".join(chunks))
+
+
+def is_running(socket_path=SOCKET_PATH):
+    try:
+        return send("ping", timeout=1, socket_path=socket_path).get("ok", False)
+    except (DaemonNotRunning, OSError, ValueError):
+        return False
@@ -0,0 +1,315 @@
+"""
+The resident graphiti-memory daemon.
+
+Runs the session sync, file watcher and file importer as sources inside
+one process, sharing a single Graphiti client, state store and scheduler,
+and answers control commands on a Unix socket:
+
+  ping                    liveness check
+  status                  per-source runs, results, errors and next run
+  flush                   write pending state to disk and send the log spool
+  pause / resume          stop / restart scheduled and triggered runs
+  resync [source] [wait]  run one source (or all scheduled ones) now
+  search [own_group]      run one or more searches, served from a short cache
+  log [sync]              spool messages for a group; sync waits for Graphiti
+
+Logged messages go through the on-disk spool (see spool.py) and a flusher
+thread sends them in batches, so log calls return without waiting on
+Graphiti. Searches include spooled messages, so an agent always finds
+what it just logged.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+
+from . import control
+from .cache import SearchCache
+from .client import GraphitiClient
+from .scheduler import Scheduler
+from .sources import GraphitiUnavailable, load_sources
+from .spool import LINGER, Spool, merge_facts
+from .state import StateStore
+
+DEFAULT_SOURCES = ["sessions", "files", "imports"]
+# Seconds between spool checks when nobody pokes the flusher, to pick up
+# entries appended by graphiti-cli.py while the daemon was down
+SPOOL_POLL = 10
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            response = self.server.daemon.handle(request)
+        except ValueError:
+            response = {"ok": False, "error": "invalid JSON request"}
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class SpoolFlusher(threading.Thread):
+    """Sends the log spool to Graphiti in batches, shortly after each log call."""
+
+    def __init__(self, spool, client, scheduler, on_flushed):
+        super().__init__(name="spool-flusher", daemon=True)
+        self.spool = spool
+        self.client = client
+        self.scheduler = scheduler
+        self.on_flushed = on_flushed
+        self.wake = threading.Event()
+        self.stopping = False
+        self.last_errors = {}
+
+    def poke(self):
+        self.wake.set()
+
+    def stop(self):
+        self.stopping = True
+        self.wake.set()
+
+    def run(self):
+        while not self.stopping:
+            woken = self.wake.wait(SPOOL_POLL)
+            self.wake.clear()
+            if self.stopping or self.scheduler.paused:
+                continue
+            if woken:
+                time.sleep(LINGER)
+            # A bad pass must not end the thread; the spool stays on disk
+            try:
+                self.flush(wait=False)
+            except Exception as e:
+                self.last_errors = {"*": f"{type(e).__name__}: {e}"}
+                print(f"Spool flusher pass failed: {type(e).__name__}: {e}", flush=True)
+
+    def flush(self, wait=True):
+        """Flush every group. Returns messages sent; errors go to last_errors."""
+        total, errors = 0, {}
+        for group_id in self.spool.groups():
+            sent, _, error, _ = self.spool.flush_group(self.client, group_id, wait=wait)
+            if sent:
+                total += sent
+                self.on_flushed(group_id)
+            if error:
+                errors[group_id] = error
+                print(f"Spool flush for {group_id} failed: {error}", flush=True)
+        self.last_errors = errors
+        return total
+
+
+class Daemon:
+    def __init__(self, source_names=None, socket_path=control.SOCKET_PATH):
+        available = load_sources()
+        source_names = source_names or DEFAULT_SOURCES
+        unknown = [n for n in source_names if n not in available]
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+
+        self.socket_path = socket_path
+        self.started = time.time()
+        self.client = GraphitiClient()
+        self.state = StateStore()
+        self.sources = {name: available[name](self.client, self.state) for name in source_names}
+        self.scheduler = Scheduler(self.sources, after_run=self.state.save)
+        self.search_cache = SearchCache()
+        self.spool = Spool()
+        self.flusher = SpoolFlusher(self.spool, self.client, self.scheduler, self.search_cache.invalidate)
+        self.server = None
+
+    def wait_job(self, job):
+        job.wait()
+        if job.error:
+            return {"ok": False, "error": job.error}
+        return {"ok": True, "result": job.result}
+
+    def handle(self, request):
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if command == "status":
+            return {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime": round(time.time() - self.started, 1),
+                "paused": self.scheduler.paused,
+                "graphiti_url": self.client.base_url,
+                "graphiti_healthy": self.client.healthcheck(),
+                "dirty_state": self.state.dirty(),
+                "search_cache": self.search_cache.stats(),
+                "log_spool": {g: self.spool.pending_count(g) for g in self.spool.groups()},
+                "log_spool_rejected": self.spool.rejected_counts(),
+                "log_spool_errors": self.flusher.last_errors,
+                "sources": self.scheduler.snapshot(),
+            }
+        if command == "flush":
+            response = self.wait_job(self.scheduler.call(self.flush, "flush"))
+            response = dict(response, saved=response.pop("result", None))
+            response["spool_sent"] = self.flusher.flush()
+            if self.flusher.last_errors:
+                response.update(ok=False, error="log spool flush failed", spool_errors=self.flusher.last_errors)
+            return response
+        if command == "pause":
+            self.scheduler.pause()
+            return {"ok": True, "paused": True}
+        if command == "resume":
+            self.scheduler.resume()
+            return {"ok": True, "paused": False}
+        if command == "resync":
+            # "All" means the scheduled sources; trigger-only ones (the bulk
+            # file import) only run when named
+            names = ([request["source"]] if request.get("source")
+                     else [n for n, src in self.sources.items() if src.interval is not None])
+            unknown = [n for n in names if n not in self.sources]
+            if unknown:
+                return {"ok": False, "error": f"Unknown source: {', '.join(unknown)}",
+                        "unknown_sources": unknown}
+            wait = request.get("wait", False)
+            if wait and self.scheduler.paused:
+                return {"ok": False, "error": "daemon is paused"}
+            jobs = {name: self.scheduler.trigger(name) for name in names}
+            if not wait:
+                return {"ok": True, "queued": names}
+            results, errors = {}, {}
+            for name, job in jobs.items():
+                job.wait()
+                if job.error:
+                    errors[name] = job.error
+                else:
+                    results[name] = job.result
+            return {"ok": not errors, "results": results, "errors": errors}
+        if command == "search":
+            own_group = request.get("own_group")
+            return {"ok": True, "results": [self.search(s, own_group) for s in request.get("searches", [])]}
+        if command == "log":
+            group_id = request.get("group_id")
+            if not group_id or not request.get("messages"):
+                return {"ok": False, "error": "log needs group_id and messages"}
+            if request.get("sync") and self.scheduler.paused:
+                return {"ok": False, "error": "daemon is paused"}
+            try:
+                self.spool.append(group_id, request["messages"])
+            except ValueError as e:
+                return {"ok": False, "error": str(e)}
+            if not request.get("sync"):
+                self.flusher.poke()
+                return {"ok": True, "queued": True}
+            sent, rejected, error, data = self.spool.flush_group(self.client, group_id)
+            if sent:
+                self.search_cache.invalidate(group_id)
+            if error:
+                return {"ok": False, "error": f"{error} (message kept in the log spool)"}
+            if rejected:
+                return {"ok": False, "error": self.spool.rejected_error(group_id, rejected)}
+            return {"ok": True, "response": data}
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def search(self, search, own_group=None):
+        """Answer one search from the cache or Graphiti. Errors are per search.
+        own_group is the caller's group; see Spool.local_facts."""
+        query = search.get("query", "")
+        group_ids = search.get("group_ids") or []
+        max_facts = search.get("max_facts", 10)
+        key = self.search_cache.key(query, group_ids, max_facts)
+        facts = self.search_cache.get(key)
+        if facts is None:
+            try:
+                facts = self.client.search(query, group_ids, max_facts)
+            except Exception as e:
+                return {"error": f"{type(e).__name__}: {e}"}
+            self.search_cache.put(key, group_ids, facts)
+        local = self.spool.local_facts(query, group_ids, max_facts, own_group)
+        return {"facts": merge_facts(local, facts, max_facts)}
+
+    def flush(self):
+        """Persist dirty state. Runs on the scheduler thread."""
+        return self.state.save()
+
+    def bind(self):
+        """Bind the control socket, refusing to start next to a live daemon."""
+        if os.path.exists(self.socket_path):
+            if control.is_running(self.socket_path):
+                raise RuntimeError(f"graphiti-memory is already running on {self.socket_path}")
+            os.unlink(self.socket_path)
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            self.server = ControlServer(self.socket_path, ControlHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.daemon = self
+
+    def run(self):
+        self.bind()
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        # Send anything left in the spool from before the daemon started
+        self.flusher.start()
+        self.flusher.poke()
+
+        def stop(signum, frame):
+            self.scheduler.stop()
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        print(f"graphiti-memory: pid {os.getpid()}, sources {', '.join(self.sources)}, "
+              f"control socket {self.socket_path}", flush=True)
+        try:
+            self.scheduler.run_forever()
+        finally:
+            self.flusher.stop()
+            self.server.shutdown()
+            self.server.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+            self.state.save()
+            self.client.close()
+            print("graphiti-memory: stopped", flush=True)
+
+
+def run_once(name):
+    """Run one source via the daemon if it is up, otherwise in this process.
+
+    Returns the source's item count, or None if the run did not happen.
+    """
+    try:
+        response = control.send("resync", source=name, wait=True, timeout=None)
+    except (control.DaemonNotRunning, socket.timeout):
+        response = None
+    # A daemon started without this source (e.g. --sources imports) can't
+    # run it; do it here instead
+    if response is not None and name in response.get("unknown_sources", []):
+        response = None
+    if response is not None:
+        if not response.get("ok"):
+            error = response.get("errors", {}).get(name) or response.get("error")
+            print(f"graphiti-memory daemon: {name} failed: {error}")
+            return None
+        result = response["results"][name]
+        print(f"graphiti-memory daemon: {name} ran, {result} items sent")
+        return result
+
+    client = GraphitiClient()
+    state = StateStore()
+    source = load_sources()[name](client, state)
+    try:
+        return source.run()
+    except GraphitiUnavailable:
+        print("Graphiti not available")
+        return None
+    finally:
+        state.save()
+        client.close()
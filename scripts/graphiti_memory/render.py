@@ -0,0 +1,33 @@
+"""
+Text output of graphiti-cli.py's agent-facing commands, the same whether
+the results came from the daemon or straight from Graphiti.
+"""
+
+
+def as_of(fact):
+    """Fact date; logged messages Graphiti may not have ingested yet are marked pending."""
+    return f"as of {fact.get('valid_at') or 'unknown'}{', pending' if fact.get('pending') else ''}"
+
+
+def render_search(query, facts):
+    lines = [f"• {f.get('fact')} ({as_of(f)})" for f in facts]
+    if not lines:
+        lines.append(f"No facts found for query: {query}")
+    return "\n".join(lines) + "\n"
+
+
+def render_context(titles, results):
+    """Context sections; results holds a facts list, or None for a failed search, per title."""
+    out = ["=== Shared Memory Context ===", ""]
+    for i, (title, facts) in enumerate(zip(titles, results)):
+        if i:
+            out.append("")
+        out.append(f"--- {title} ---")
+        if isinstance(facts, list):
+            out.extend(f"• {f.get('fact')}{' (pending)' if f.get('pending') else ''}" for f in facts)
+    return "\n".join(out) + "\n"
+
+
+def render_log(response):
+    response = response or {}
+    return (response.get("result") or response.get("message") or "Logged successfully") + "\n"
@@ -0,0 +1,152 @@
+"""
+Single-threaded scheduler for the daemon's sources.
+
+Sources run one at a time on the scheduler thread, either when their
+interval elapses or when triggered through the control API. Other work
+that touches source state (such as saving it) is queued onto the same
+thread so it never races a running source.
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from .sources import GraphitiUnavailable
+
+
+class Job:
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self, timeout=None):
+        self.done.wait(timeout)
+        return self.done.is_set()
+
+
+class Scheduler:
+    def __init__(self, sources, after_run=None):
+        self.sources = sources
+        self.after_run = after_run
+        self.paused = False
+        self.stopping = False
+        self.cond = threading.Condition()
+        self.queue = deque()
+        now = time.monotonic()
+        # Interval sources run once at startup, like launchd's RunAtLoad
+        self.next_run = {name: (now if src.interval else None) for name, src in sources.items()}
+        self.status = {
+            name: {"interval": src.interval, "runs": 0, "last_run": None,
+                   "last_duration": None, "last_result": None, "last_error": None}
+            for name, src in sources.items()
+        }
+
+    def trigger(self, name):
+        """Queue a run of one source. Returns the Job to wait on."""
+        if name not in self.sources:
+            raise KeyError(f"Unknown source: {name}")
+        return self.submit(name, None)
+
+    def call(self, fn, name="call"):
+        """Queue an arbitrary callable onto the scheduler thread."""
+        return self.submit(name, fn)
+
+    def submit(self, name, fn):
+        job = Job(name, fn)
+        with self.cond:
+            self.queue.append(job)
+            self.cond.notify()
+        return job
+
+    def pause(self):
+        with self.cond:
+            self.paused = True
+
+    def resume(self):
+        with self.cond:
+            self.paused = False
+            self.cond.notify()
+
+    def stop(self):
+        with self.cond:
+            self.stopping = True
+            self.cond.notify()
+
+    def snapshot(self):
+        with self.cond:
+            now = time.monotonic()
+            result = {}
+            for name, info in self.status.items():
+                due = self.next_run.get(name)
+                result[name] = dict(info, next_run_in=None if due is None else max(0.0, round(due - now, 1)))
+            return result
+
+    def _next_job(self):
+        """Block until a job is runnable; return it, or None when stopping."""
+        with self.cond:
+            while not self.stopping:
+                # Queued callables (e.g. flush) run even while paused
+                for job in list(self.queue):
+                    if job.fn is not None or not self.paused:
+                        self.queue.remove(job)
+                        return job
+                timeout = None
+                if not self.paused:
+                    now = time.monotonic()
+                    due = [(t, n) for n, t in self.next_run.items() if t is not None]
+                    if due:
+                        when, name = min(due)
+                        if when <= now:
+                            return Job(name, None)
+                        timeout = when - now
+                self.cond.wait(timeout)
+            return None
+
+    def _run_source(self, job):
+        source = self.sources[job.name]
+        info = self.status[job.name]
+        started = time.monotonic()
+        try:
+            job.result = source.run()
+            info["last_error"] = None
+        except GraphitiUnavailable as e:
+            job.error = str(e)
+            info["last_error"] = job.error
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            info["last_error"] = job.error
+            print(f"Source {job.name} failed: {job.error}", flush=True)
+        finished = time.monotonic()
+        with self.cond:
+            info["runs"] += 1
+            info["last_run"] = datetime.now().isoformat(timespec="seconds")
+            info["last_duration"] = round(finished - started, 3)
+            info["last_result"] = job.result
+            if source.interval:
+                self.next_run[job.name] = finished + source.interval
+        if self.after_run:
+            self.after_run()
+
+    def run_forever(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                break
+            if job.fn is not None:
+                try:
+                    job.result = job.fn()
+                except Exception as e:
+                    job.error = f"{type(e).__name__}: {e}"
+            else:
+                self._run_source(job)
+            job.done.set()
+        # Release anyone still waiting on queued work
+        with self.cond:
+            for job in self.queue:
+                job.error = "daemon stopping"
+                job.done.set()
+            self.queue.clear()
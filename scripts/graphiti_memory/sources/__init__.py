@@ -0,0 +1,41 @@
+"""
+Pluggable sync sources for the graphiti-memory daemon.
+
+A source is a class with a `name`, a default `interval` in seconds (None
+for sources that only run when triggered) and a `run()` method returning
+how many items it sent. Register new sources with @register.
+"""
+
+SOURCES = {}
+
+
+class GraphitiUnavailable(Exception):
+    """Graphiti did not pass its healthcheck, so the run was skipped."""
+
+
+class Source:
+    name = None
+    interval = None
+
+    def __init__(self, client, state):
+        self.client = client
+        self.state = state
+
+    def require_graphiti(self):
+        if not self.client.healthcheck():
+            raise GraphitiUnavailable(f"Graphiti not available at {self.client.base_url}")
+
+    def run(self):
+        raise NotImplementedError
+
+
+def register(cls):
+    """Class decorator adding a source to SOURCES under its name."""
+    SOURCES[cls.name] = cls
+    return cls
+
+
+def load_sources():
+    """Import the built-in source modules so they register themselves."""
+    from . import files, imports, sessions  # noqa: F401
+    return SOURCES
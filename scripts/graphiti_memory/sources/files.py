@@ -0,0 +1,225 @@
+"""
+Watch memory files for changes and sync to Graphiti with contextual summaries.
+"""
+
+import difflib
+import hashlib
+import re
+import sys
+from datetime import datetime
+
+from . import Source, register
+from .. import CLAWD_DIR, MEMORY_DIR, STATE_DIR
+
+STATE_FILE = "graphiti-file-hashes.json"
+CONTENT_CACHE_DIR = STATE_DIR / "file-cache"
+
+WATCHED_FILES = [
+    CLAWD_DIR / "MEMORY.md",
+    CLAWD_DIR / "IDENTITY.md",
+    CLAWD_DIR / "USER.md",
+]
+
+
+def file_hash(filepath):
+    if not filepath.exists():
+        return None
+    return hashlib.md5(filepath.read_bytes()).hexdigest()
+
+
+def get_cached_content(filepath):
+    """Get previous version of file from cache."""
+    cache_file = CONTENT_CACHE_DIR / f"{filepath.name}.cache"
+    if cache_file.exists():
+        return cache_file.read_text()
+    return ""
+
+
+def save_cached_content(filepath, content):
+    """Save current version to cache."""
+    CONTENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = CONTENT_CACHE_DIR / f"{filepath.name}.cache"
+    cache_file.write_text(content)
+
+
+def extract_headings(text):
+    """Extract markdown headings from text."""
+    headings = re.findall(r'^#{1,6}\s+(.+)$', text, re.MULTILINE)
+    return headings
+
+
+def generate_diff_summary(old_content, new_content, filename):
+    """Generate a human-readable summary of what changed."""
+    old_lines = old_content.splitlines() if old_content else []
+    new_lines = new_content.splitlines()
+
+    # Get unified diff
+    diff = list(difflib.unified_diff(old_lines, new_lines, lineterm='', n=2))
+
+    if not diff:
+        return None
+
+    # Analyze the diff
+    added_lines = [line[1:] for line in diff if line.startswith('+') and not line.startswith('+++')]
+    removed_lines = [line[1:] for line in diff if line.startswith('-') and not line.startswith('---')]
+
+    # Get headings context
+    new_headings = extract_headings(new_content)
+    old_headings = extract_headings(old_content)
+
+    added_sections = [h for h in new_headings if h not in old_headings]
+    removed_sections = [h for h in old_headings if h not in new_headings]
+
+    # Build summary
+    summary_parts = []
+
+    if added_sections:
+        sections_str = ', '.join(f'"{s}"' for s in added_sections[:3])
+        if len(added_sections) > 3:
+            sections_str += f" and {len(added_sections) - 3} more"
+        summary_parts.append(f"Added sections: {sections_str}")
+
+    if removed_sections:
+        sections_str = ', '.join(f'"{s}"' for s in removed_sections[:2])
+        summary_parts.append(f"Removed sections: {sections_str}")
+
+    # Check for key facts in additions
+    key_patterns = [
+        (r'\b(decided|decision)\b', 'decisions'),
+        (r'\b(created|added|implemented|built)\b', 'new items'),
+        (r'\b(updated|changed|modified)\b', 'updates'),
+        (r'\b(fixed|resolved|solved)\b', 'fixes'),
+        (r'\b(configured|setup|installed)\b', 'configuration'),
+        (r'\b(completed|finished|done)\b', 'completions'),
+    ]
+
+    changes_found = []
+    for pattern, label in key_patterns:
+        matches = [line for line in added_lines if re.search(pattern, line, re.IGNORECASE) and len(line) > 10]
+        if matches:
+            changes_found.append((label, matches[:2]))
+
+    if changes_found:
+        for label, matches in changes_found[:2]:
+            for match in matches[:1]:
+                # Clean up the match
+                clean = match.strip().rstrip('.')
+                if len(clean) > 80:
+                    clean = clean[:77] + "..."
+                summary_parts.append(f"{label}: {clean}")
+
+    # Fallback: just note lines changed
+    if not summary_parts:
+        if len(added_lines) > 0:
+            summary_parts.append(f"Added {len(added_lines)} lines")
+        if len(removed_lines) > 0:
+            summary_parts.append(f"Removed {len(removed_lines)} lines")
+
+    # Get the first meaningful added line as context
+    context = ""
+    for line in added_lines:
+        stripped = line.strip()
+        if stripped and not stripped.startswith('#') and len(stripped) > 15:
+            context = stripped[:120]
+            if len(stripped) > 120:
+                context += "..."
+            break
+
+    summary = f"File updated: {filename}"
+    if summary_parts:
+        summary += " — " + "; ".join(summary_parts[:3])
+    if context:
+        summary += f"\nContext: {context}"
+
+    return summary
+
+
+@register
+class FileWatchSource(Source):
+    """Sends a diff summary for each changed core file, daily log and project doc."""
+
+    name = "files"
+    interval = 600
+
+    def load_state(self):
+        return self.state.load(STATE_FILE, lambda: {"file_hashes": {}, "last_summaries": {}})
+
+    def send_summary_to_graphiti(self, summary, timestamp, source, filepath, content):
+        """Send a contextual summary to Graphiti instead of full content."""
+        try:
+            self.client.add_messages("clawdbot-main", [{
+                "role_type": "system",
+                "role": "FileUpdate",
+                "content": summary,
+                "timestamp": timestamp,
+                "source_description": source,
+                "metadata": {
+                    "file": filepath.name,
+                    "type": "file-change-summary",
+                    "lines": len(content.splitlines())
+                }
+            }])
+            return True
+        except Exception as e:
+            print(f"Error sending to Graphiti: {e}", file=sys.stderr)
+            return False
+
+    def sync_file_with_summary(self, filepath, state):
+        """Sync a file with contextual summary if it has changed."""
+        current_hash = file_hash(filepath)
+        stored_hash = state["file_hashes"].get(str(filepath))
+
+        if current_hash == stored_hash:
+            return False  # No change
+
+        if not filepath.exists():
+            return False
+
+        new_content = filepath.read_text()
+        old_content = get_cached_content(filepath)
+
+        mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
+        timestamp = mtime.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        # Generate contextual summary
+        summary = generate_diff_summary(old_content, new_content, filepath.name)
+
+        if not summary:
+            summary = f"File updated: {filepath.name} (minor changes)"
+
+        source = f"file-update:{filepath.name}"
+
+        if self.send_summary_to_graphiti(summary, timestamp, source, filepath, new_content):
+            state["file_hashes"][str(filepath)] = current_hash
+            state["last_summaries"][str(filepath)] = summary[:200]
+            self.state.mark_dirty(STATE_FILE)
+            save_cached_content(filepath, new_content)
+            print(f"✓ Synced {filepath.name}: {summary[:80]}...")
+            return True
+        else:
+            print(f"✗ Failed to sync {filepath.name}")
+            return False
+
+    def run(self):
+        self.require_graphiti()
+
+        state = self.load_state()
+        synced = 0
+
+        # Sync watched files
+        for filepath in WATCHED_FILES:
+            if filepath.exists() and self.sync_file_with_summary(filepath, state):
+                synced += 1
+
+        # Sync daily logs and project files
+        for subdir in ("logs", "projects"):
+            directory = MEMORY_DIR / subdir
+            if directory.exists():
+                for filepath in directory.glob("*.md"):
+                    if self.sync_file_with_summary(filepath, state):
+                        synced += 1
+
+        if synced > 0:
+            print(f"Graphiti file sync: {synced} files updated with contextual summaries")
+
+        return synced
@@ -0,0 +1,186 @@
+"""
+Import file-based memory into Graphiti with temporal context.
+Uses filenames (daily logs) or file mtime for timestamps.
+"""
+
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+from . import Source, register
+from .. import CLAWD_DIR, MEMORY_DIR
+
+RATE_LIMIT_DELAY = float(os.environ.get("GRAPHITI_RATE_LIMIT_DELAY", "0.5"))
+
+
+def parse_daily_log(filepath):
+    """Parse a daily log file and extract sections."""
+    content = filepath.read_text()
+
+    # Get date from filename (YYYY-MM-DD.md)
+    date_match = re.search(r'(\d{4}-\d{2}-\d{2})', filepath.name)
+    if not date_match:
+        return []
+
+    log_date = date_match.group(1)
+    timestamp = f"{log_date}T12:00:00Z"  # Noon on that day
+
+    # Split by ## headers to get sections
+    sections = re.split(r'\n##\s+', content)
+
+    results = []
+    for section in sections:
+        if not section.strip():
+            continue
+
+        # Get section title and content
+        lines = section.strip().split('\n')
+        title = lines[0].strip('# ')
+        body = '\n'.join(lines[1:]).strip()
+
+        if body and len(body) > 20:
+            # Try to extract time from section title (e.g., "Setup (10:30 AST)")
+            time_match = re.search(r'\((\d{1,2}):(\d{2})', title)
+            if time_match:
+                hour, minute = time_match.groups()
+                timestamp = f"{log_date}T{hour.zfill(2)}:{minute}:00Z"
+
+            results.append({
+                "title": title,
+                "content": f"Daily log {log_date} - {title}:\n{body}",
+                "timestamp": timestamp,
+                "source": str(filepath)
+            })
+
+    return results
+
+
+def parse_project_doc(filepath):
+    """Parse a project doc, using file mtime for timestamp."""
+    content = filepath.read_text()
+    mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
+    timestamp = mtime.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    # Get title from first # header or filename
+    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    title = title_match.group(1) if title_match else filepath.stem
+
+    # Extract key points (look for bullet points, decisions, etc.)
+    # For now, just send the first ~2000 chars as context
+    summary = content[:2000]
+    if len(content) > 2000:
+        summary += "\n[...see full file]"
+
+    return {
+        "title": title,
+        "content": f"Project doc '{title}' (last updated {mtime.strftime('%Y-%m-%d')}):\n{summary}",
+        "timestamp": timestamp,
+        "source": str(filepath)
+    }
+
+
+@register
+class FileImportSource(Source):
+    """Bulk import of daily logs, project docs and identity files. Trigger-only."""
+
+    name = "imports"
+    interval = None
+
+    def send_to_graphiti(self, group_id, role_type, role, content, timestamp, source_desc=""):
+        """Send content to Graphiti."""
+        # Truncate long content
+        if len(content) > 3000:
+            content = content[:3000] + "\n[...truncated]"
+
+        try:
+            self.client.add_messages(group_id, [{
+                "role_type": role_type,
+                "role": role,
+                "content": content,
+                "timestamp": timestamp,
+                "source_description": source_desc
+            }], timeout=60)
+            return True
+        except Exception as e:
+            print(f"  Error: {e}", file=sys.stderr)
+            return False
+
+    def send_item(self, role, title, content, timestamp, source_desc):
+        ok = self.send_to_graphiti("clawdbot-main", "system", role, content, timestamp, source_desc)
+        print(f"  {'✓' if ok else '✗'} {title}")
+        if RATE_LIMIT_DELAY:
+            time.sleep(RATE_LIMIT_DELAY)
+        return ok
+
+    def import_daily_logs(self):
+        """Import all daily logs."""
+        logs_dir = MEMORY_DIR / "logs"
+        if not logs_dir.exists():
+            return 0
+
+        count = 0
+        for logfile in sorted(logs_dir.glob("*.md")):
+            print(f"Processing {logfile.name}...")
+            for section in parse_daily_log(logfile):
+                if self.send_item("DailyLog", section["title"], section["content"],
+                                  section["timestamp"], f"daily-log:{logfile.name}"):
+                    count += 1
+        return count
+
+    def import_project_docs(self):
+        """Import project documentation."""
+        projects_dir = MEMORY_DIR / "projects"
+        if not projects_dir.exists():
+            return 0
+
+        count = 0
+        for docfile in sorted(projects_dir.glob("*.md")):
+            print(f"Processing {docfile.name}...")
+            doc = parse_project_doc(docfile)
+            if self.send_item("ProjectDoc", doc["title"], doc["content"],
+                              doc["timestamp"], f"project-doc:{docfile.name}"):
+                count += 1
+        return count
+
+    def import_identity_files(self):
+        """Import core identity files."""
+        files = [
+            (CLAWD_DIR / "MEMORY.md", "LongTermMemory"),
+            (CLAWD_DIR / "IDENTITY.md", "Identity"),
+            (CLAWD_DIR / "USER.md", "UserProfile"),
+        ]
+
+        count = 0
+        for filepath, role in files:
+            if not filepath.exists():
+                continue
+
+            print(f"Processing {filepath.name}...")
+            content = filepath.read_text()
+            mtime = datetime.fromtimestamp(filepath.stat().st_mtime)
+            timestamp = mtime.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+            if self.send_item(role, filepath.name, f"Core file {filepath.name}:\n{content[:3000]}",
+                              timestamp, f"core:{filepath.name}"):
+                count += 1
+        return count
+
+    def run(self):
+        print("=== Graphiti File Import ===\n")
+        self.require_graphiti()
+
+        total = 0
+
+        print("\n--- Daily Logs ---")
+        total += self.import_daily_logs()
+
+        print("\n--- Project Docs ---")
+        total += self.import_project_docs()
+
+        print("\n--- Identity Files ---")
+        total += self.import_identity_files()
+
+        print(f"\n=== Done: {total} items imported ===")
+        return total
@@ -0,0 +1,146 @@
+"""
+Sync Clawdbot session messages to the Graphiti knowledge graph.
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from . import Source, register
+
+SESSIONS_DIR = Path.home() / ".clawdbot/agents/main/sessions"
+SYNC_STATE_FILE = "graphiti-sync-state.json"
+MAX_MESSAGES_PER_RUN = int(os.environ.get("GRAPHITI_SYNC_MAX_MESSAGES", "50"))
+RATE_LIMIT_DELAY = float(os.environ.get("GRAPHITI_RATE_LIMIT_DELAY", "0.3"))
+
+
+def extract_text_content(content):
+    """Extract text from message content."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        texts = []
+        for item in content:
+            if isinstance(item, dict) and item.get('type') == 'text':
+                texts.append(item.get('text', ''))
+            elif isinstance(item, str):
+                texts.append(item)
+        return ' '.join(texts)
+    return ''
+
+
+def should_sync_message(content):
+    """Determine if a message should be synced."""
+    if not content or len(content) < 10:
+        return False
+
+    # Skip system/internal messages
+    skip_patterns = [
+        '[Signal', '[Slack', 'HEARTBEAT', 'NO_REPLY',
+        '✅ New session', 'System:', '[message_id:'
+    ]
+    for pattern in skip_patterns:
+        if pattern in content:
+            return False
+
+    return True
+
+
+@register
+class SessionSource(Source):
+    """Sends new user/assistant messages from recent session transcripts."""
+
+    name = "sessions"
+    interval = 1800
+
+    def load_state(self):
+        return self.state.load(SYNC_STATE_FILE, lambda: {"synced_messages": {}, "last_sync": None})
+
+    def send_to_graphiti(self, group_id, role_type, role, content, timestamp):
+        """Send a message to Graphiti."""
+        try:
+            self.client.add_messages(group_id, [{
+                "role_type": role_type,
+                "role": role,
+                "content": content[:2000],  # Truncate long messages
+                "timestamp": timestamp
+            }])
+            return True
+        except Exception as e:
+            print(f"Error sending to Graphiti: {e}", file=sys.stderr)
+            return False
+
+    def run(self):
+        self.require_graphiti()
+
+        state = self.load_state()
+        synced_count = 0
+
+        # Find session files modified in last 24 hours
+        cutoff = datetime.now() - timedelta(hours=24)
+        session_files = []
+
+        if SESSIONS_DIR.exists():
+            for f in SESSIONS_DIR.glob("*.jsonl"):
+                if datetime.fromtimestamp(f.stat().st_mtime) > cutoff:
+                    session_files.append(f)
+
+        for session_file in sorted(session_files, key=lambda x: x.stat().st_mtime):
+            if synced_count >= MAX_MESSAGES_PER_RUN:
+                break
+
+            try:
+                with open(session_file, 'r') as f:
+                    for line in f:
+                        if synced_count >= MAX_MESSAGES_PER_RUN:
+                            break
+
+                        try:
+                            entry = json.loads(line.strip())
+                        except json.JSONDecodeError:
+                            continue
+
+                        # Only process message entries
+                        if entry.get('type') != 'message':
+                            continue
+
+                        msg_id = entry.get('id')
+                        if not msg_id or msg_id in state['synced_messages']:
+                            continue
+
+                        message = entry.get('message', {})
+                        role = message.get('role', '')
+                        timestamp = entry.get('timestamp', datetime.now().isoformat())
+
+                        # Only sync user and assistant messages
+                        if role not in ('user', 'assistant'):
+                            continue
+
+                        content = extract_text_content(message.get('content', ''))
+
+                        if not should_sync_message(content):
+                            continue
+
+                        # Determine role_type and speaker
+                        role_type = 'user' if role == 'user' else 'assistant'
+                        speaker = 'User' if role == 'user' else 'Agent'
+
+                        if self.send_to_graphiti('clawdbot-main', role_type, speaker, content, timestamp):
+                            state['synced_messages'][msg_id] = datetime.now().isoformat()
+                            self.state.mark_dirty(SYNC_STATE_FILE)
+                            synced_count += 1
+                            if RATE_LIMIT_DELAY:
+                                time.sleep(RATE_LIMIT_DELAY)  # Rate limit
+
+            except Exception as e:
+                print(f"Error processing {session_file}: {e}", file=sys.stderr)
+                continue
+
+        state['last_sync'] = datetime.now().isoformat()
+        self.state.mark_dirty(SYNC_STATE_FILE)
+
+        print(f"Graphiti sync: {synced_count} messages synced")
+        return synced_count
@@ -0,0 +1,350 @@
+"""
+Per-group write spool for agent log calls.
+
+graphiti-log.sh appends each message to ~/.clawdbot/graphiti-spool/<group>.jsonl
+and returns; a flusher (the daemon, or a background graphiti-cli.py
+flush-spool when no daemon runs) later sends the spool to Graphiti in
+ordered batches, several messages per /messages call.
+
+Files per group:
+  <group>.jsonl           appended to by log calls
+  <group>.<ns>.batch      claimed spool contents being sent, oldest first
+  <group>.recent.jsonl    sent recently; the group's own searches still
+                          see them until Graphiti has had time to ingest them
+  <group>.rejected.jsonl  messages Graphiti refused (4xx), set aside so
+                          they don't hold up the rest of the spool
+  <group>.lock            held briefly to append or claim
+  <group>.flush.lock      held by the one flusher working on the group
+  <group>.flusher.lock    held by a background flush-spool process for
+                          as long as it runs, retries included
+
+Each spool line is {"spooled_at": <epoch>, "message": {...}}.
+"""
+
+import fcntl
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from . import STATE_DIR
+
+SPOOL_DIR = Path(os.environ.get("GRAPHITI_SPOOL_DIR", str(STATE_DIR / "graphiti-spool")))
+# Messages per /messages call
+BATCH_SIZE = int(os.environ.get("GRAPHITI_SPOOL_BATCH", "20"))
+# Seconds a flusher waits after being woken so a burst of calls coalesces
+LINGER = float(os.environ.get("GRAPHITI_SPOOL_LINGER", "0.5"))
+# Seconds sent messages stay searchable locally while Graphiti ingests them
+RECENT_TTL = int(os.environ.get("GRAPHITI_SPOOL_RECENT_TTL", "600"))
+
+
+# Graphiti only accepts these characters in group ids, which also makes
+# them safe to use as file names
+GROUP_ID_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+
+ROLE_TYPES = ("user", "assistant", "system")
+
+
+def check_group_id(group_id):
+    if not GROUP_ID_RE.match(group_id or ""):
+        raise ValueError(f"Invalid group_id {group_id!r}: use letters, digits, '-' and '_'")
+    return group_id
+
+
+def check_messages(messages):
+    """Reject messages Graphiti would refuse, before they are spooled."""
+    if not isinstance(messages, list) or not messages:
+        raise ValueError("messages must be a non-empty list")
+    for message in messages:
+        if not isinstance(message, dict) or not isinstance(message.get("content"), str):
+            raise ValueError("each message needs a content string")
+        if message.get("role_type") not in ROLE_TYPES:
+            raise ValueError(f"Invalid role_type {message.get('role_type')!r}: use {', '.join(ROLE_TYPES)}")
+        timestamp = message.get("timestamp")
+        if timestamp is not None:
+            try:
+                datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+            except ValueError:
+                raise ValueError(f"Invalid timestamp {timestamp!r}: use ISO 8601") from None
+    return messages
+
+
+@contextmanager
+def locked(path, blocking=True):
+    """Hold an exclusive flock on path. Yields False if non-blocking and busy."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+    finally:
+        os.close(fd)
+
+
+def read_entries(path):
+    """Spool entries in path, skipping lines that are not whole entries
+    (e.g. one cut short by a crash mid-append)."""
+    entries = []
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and isinstance(entry.get("message"), dict):
+                    entries.append(entry)
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def write_entries(path, entries):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text("".join(json.dumps(e) + "\n" for e in entries), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def query_words(text):
+    return {w for w in re.findall(r'\w+', text.lower()) if len(w) > 2}
+
+
+def fact_key(text):
+    return " ".join(re.findall(r'\w+', (text or "").lower()))
+
+
+class Spool:
+    def __init__(self, spool_dir=SPOOL_DIR):
+        self.dir = Path(spool_dir)
+
+    def paths(self, group_id):
+        name = check_group_id(group_id)
+        return {
+            "spool": self.dir / f"{name}.jsonl",
+            "recent": self.dir / f"{name}.recent.jsonl",
+            "rejected": self.dir / f"{name}.rejected.jsonl",
+            "lock": self.dir / f"{name}.lock",
+            "flush_lock": self.dir / f"{name}.flush.lock",
+            "flusher_lock": self.dir / f"{name}.flusher.lock",
+        }
+
+    def batches(self, group_id):
+        return sorted(self.dir.glob(f"{check_group_id(group_id)}.*.batch"))
+
+    def groups(self):
+        """Groups with anything spooled or in flight."""
+        if not self.dir.exists():
+            return []
+        groups = set()
+        for path in self.dir.iterdir():
+            if path.suffix == ".batch":
+                groups.add(path.name.split(".")[0])
+            elif path.suffix == ".jsonl" and path.name.count(".") == 1 and path.stat().st_size:
+                groups.add(path.stem)
+        return sorted(groups)
+
+    def append(self, group_id, messages):
+        """Spool messages for group_id, in order. Raises ValueError for
+        messages Graphiti would refuse."""
+        paths = self.paths(group_id)
+        check_messages(messages)
+        now = time.time()
+        data = "".join(json.dumps({"spooled_at": now, "message": m}) + "\n" for m in messages)
+        with locked(paths["lock"]):
+            with open(paths["spool"], "a", encoding='utf-8') as f:
+                f.write(data)
+
+    def claim(self, group_id):
+        """Move the current spool aside as a new batch file. Returns its path or None."""
+        paths = self.paths(group_id)
+        with locked(paths["lock"]):
+            try:
+                if not paths["spool"].stat().st_size:
+                    return None
+            except FileNotFoundError:
+                return None
+            batch = self.dir / f"{group_id}.{time.time_ns()}.batch"
+            os.rename(paths["spool"], batch)
+            return batch
+
+    def pending_count(self, group_id):
+        paths = self.paths(group_id)
+        return sum(len(read_entries(p)) for p in self.batches(group_id) + [paths["spool"]])
+
+    def rejected_counts(self):
+        """Messages set aside as refused by Graphiti, per group."""
+        return {p.name.split(".")[0]: len(read_entries(p)) for p in sorted(self.dir.glob("*.rejected.jsonl"))}
+
+    def rejected_error(self, group_id, rejected):
+        return f"Graphiti rejected {rejected} spooled message(s); set aside in {self.paths(group_id)['rejected']}"
+
+    def flush_group(self, client, group_id, wait=True, linger=0):
+        """Send everything spooled for group_id, oldest first.
+
+        Returns (sent, rejected, error, last Graphiti response). A chunk
+        Graphiti refuses (4xx) is resent one message at a time and the
+        refused messages are moved to the rejected file. Any other failure
+        (5xx, connection) stops the flush and leaves the rest on disk for
+        the next attempt, so order is never broken. With wait=False,
+        returns straight away if another flusher is already working on the
+        group. linger waits after taking the flush lock so a burst of
+        appends coalesces.
+        """
+        paths = self.paths(group_id)
+        sent = rejected = 0
+        response = None
+        while True:
+            with locked(paths["flush_lock"], blocking=wait) as acquired:
+                if not acquired:
+                    break
+                if linger:
+                    time.sleep(linger)
+                while True:
+                    batches = self.batches(group_id)
+                    if not batches:
+                        claimed = self.claim(group_id)
+                        if claimed is None:
+                            break
+                        batches = [claimed]
+                    for batch in batches:
+                        entries = read_entries(batch)
+                        if not entries:
+                            print(f"Spool: dropping {batch.name}, no readable entries", file=sys.stderr, flush=True)
+                            batch.unlink()
+                            continue
+                        while entries:
+                            chunk = entries[:BATCH_SIZE]
+                            done, refused, error, chunk_response = self.send(client, group_id, chunk)
+                            response = chunk_response or response
+                            entries = entries[len(done) + len(refused):]
+                            sent += len(done)
+                            rejected += len(refused)
+                            if done or refused:
+                                self.advance(group_id, batch, done, refused, entries)
+                            if error:
+                                return sent, rejected, error, response
+            # An append that raced our exit saw the lock held and left its
+            # entries to us; pick them up unless a new flusher already has
+            if not self.pending_count(group_id):
+                break
+            wait, linger = False, 0
+        return sent, rejected, None, response
+
+    def send(self, client, group_id, chunk):
+        """Send one chunk. Returns (sent, refused, error, response) where
+        sent + refused is the prefix of chunk that was dealt with."""
+        try:
+            return chunk, [], None, client.add_messages(group_id, [e["message"] for e in chunk])
+        except Exception as e:
+            if not getattr(e, "rejected", False):
+                return [], [], f"{type(e).__name__}: {e}", None
+        # One bad message must not hold up the rest: find it by sending singly
+        done, refused, response = [], [], None
+        for entry in chunk:
+            try:
+                response = client.add_messages(group_id, [entry["message"]])
+            except Exception as e:
+                if not getattr(e, "rejected", False):
+                    return done, refused, f"{type(e).__name__}: {e}", response
+                refused.append(dict(entry, rejected_at=time.time(), error=str(e)))
+                print(f"Spool: Graphiti rejected a message for {group_id}: {e}", file=sys.stderr, flush=True)
+                continue
+            done.append(entry)
+        return done, refused, None, response
+
+    def advance(self, group_id, batch, sent, refused, remaining):
+        """Move dealt-with entries out of a batch file (sent ones to the
+        recent file, refused ones to the rejected file), atomically with
+        respect to appends and local searches."""
+        paths = self.paths(group_id)
+        now = time.time()
+        cutoff = now - RECENT_TTL
+        with locked(paths["lock"]):
+            if sent:
+                recent = [e for e in read_entries(paths["recent"]) if e.get("sent_at", 0) >= cutoff]
+                recent.extend(dict(e, sent_at=now) for e in sent)
+                write_entries(paths["recent"], recent)
+            if refused:
+                with open(paths["rejected"], "a", encoding='utf-8') as f:
+                    f.write("".join(json.dumps(e) + "\n" for e in refused))
+            if remaining:
+                write_entries(batch, remaining)
+            elif batch.exists():
+                batch.unlink()
+
+    def local_facts(self, query, group_ids=None, limit=10, own_group=None):
+        """Spooled and in-flight messages for group_ids matching query,
+        newest first.
+
+        Gives log callers read-your-writes: what they logged shows up in
+        their next search even before Graphiti has ingested it. Messages
+        already sent are only included for own_group, the caller's own
+        group, and a search across all groups (no group_ids) only sees
+        own_group's messages, never other agents' unsent ones.
+        """
+        if not self.dir.exists():
+            return []
+        names = group_ids or ([own_group] if own_group else [])
+        names = {g for g in names if GROUP_ID_RE.match(g or "")}
+        words = query_words(query)
+        cutoff = time.time() - RECENT_TTL
+        facts = []
+        for name in sorted(names):
+            paths = self.paths(name)
+            if not paths["lock"].exists():
+                continue
+            with locked(paths["lock"]):
+                entries = []
+                if name == own_group:
+                    entries = read_entries(paths["recent"])
+                    if paths["recent"].exists() and all(e.get("sent_at", 0) < cutoff for e in entries):
+                        paths["recent"].unlink()
+                for path in self.batches(name) + [paths["spool"]]:
+                    entries.extend(read_entries(path))
+            for entry in entries:
+                if entry.get("sent_at", cutoff) < cutoff:
+                    continue
+                message = entry.get("message", {})
+                content = message.get("content", "")
+                if words and not words & query_words(content):
+                    continue
+                facts.append((entry.get("spooled_at", 0), {
+                    "fact": content,
+                    "valid_at": message.get("timestamp"),
+                    "pending": True,
+                }))
+        facts.sort(key=lambda item: item[0], reverse=True)
+        return [fact for _, fact in facts[:limit]]
+
+
+def merge_facts(local, remote, max_facts):
+    """Local (pending) facts first, then Graphiti's, capped at max_facts.
+
+    Local facts Graphiti already returns are dropped, and the rest take at
+    most half the slots unless Graphiti has too few facts to fill them.
+    """
+    if not local:
+        return remote
+    known = [fact_key(f.get("fact")) for f in remote]
+    local = [f for f in local if not any(same_fact(fact_key(f.get("fact")), k) for k in known)]
+    local = local[:max(max_facts // 2 or 1, max_facts - len(remote))]
+    return (local + remote)[:max_facts]
+
+
+def same_fact(a, b):
+    """Whether two normalised facts say the same thing: equal, or one
+    quoting the other (Graphiti often returns a logged message nearly
+    verbatim)."""
+    if a == b:
+        return bool(a)
+    shorter, longer = sorted((a, b), key=len)
+    return len(shorter) >= 20 and shorter in longer
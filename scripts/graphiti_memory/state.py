@@ -0,0 +1,90 @@
+"""
+JSON state files shared by the sync sources.
+
+Each file is loaded once and kept in memory; save() only rewrites files
+that were marked dirty, and always via an atomic rename so a crash or a
+concurrent reader never sees a half-written file.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from . import STATE_DIR
+
+
+def atomic_write_text(path, text, mode=None):
+    """Write text to path via a temp file in the same directory and rename.
+
+    The file gets mode if given (mkstemp's 0600 otherwise).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        with os.fdopen(fd, "w", encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class StateStore:
+    """In-memory cache of named JSON state files under STATE_DIR."""
+
+    def __init__(self, state_dir=STATE_DIR):
+        self.state_dir = Path(state_dir)
+        self._docs = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+
+    def path(self, name):
+        return self.state_dir / name
+
+    def load(self, name, default):
+        """Return the document for name, reading it from disk on first use."""
+        with self._lock:
+            if name not in self._docs:
+                doc = None
+                path = self.path(name)
+                if path.exists():
+                    try:
+                        doc = json.loads(path.read_text())
+                    except (OSError, ValueError):
+                        doc = None
+                if not isinstance(doc, dict):
+                    doc = default()
+                else:
+                    for key, value in default().items():
+                        doc.setdefault(key, value)
+                self._docs[name] = doc
+            return self._docs[name]
+
+    def mark_dirty(self, name):
+        with self._lock:
+            self._dirty.add(name)
+
+    def save(self, name=None):
+        """Persist dirty documents (or just name). Returns how many were written."""
+        with self._lock:
+            names = [name] if name else sorted(self._dirty)
+            written = 0
+            for n in names:
+                if n not in self._dirty or n not in self._docs:
+                    continue
+                atomic_write_text(self.path(n), json.dumps(self._docs[n], indent=2))
+                self._dirty.discard(n)
+                written += 1
+            return written
+
+    def dirty(self):
+        with self._lock:
+            return sorted(self._dirty)
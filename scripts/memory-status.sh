@@ -24,6 +24,7 @@ QMD_PATH="${QMD_PATH:-$HOME/.bun/bin/qmd}"
 GRAPHITI_URL="${GRAPHITI_URL:-http://localhost:8001}"
 MEMORY_DIR="${MEMORY_DIR:-$HOME/clawd/memory}"
 CLAWD_DIR="${CLAWD_DIR:-$HOME/clawd}"
+SCRIPT_DIR="${SCRIPT_DIR:-$CLAWD_DIR/scripts}"
 
 # Status variables
 QMD_OK=false
@@ -83,33 +84,38 @@ check_docker() {
     fi
 }
 
-# Check sync daemons
+# Check the graphiti-memory daemon (session sync + file sync)
 check_daemons() {
-    if launchctl list 2>/dev/null | grep -q "com.clawd.graphiti-file-sync"; then
-        FILE_SYNC_OK=true
-        FILE_SYNC_DAEMON_MSG="${GREEN}✓${NC} File sync daemon running"
+    DAEMON_STATUS=$(python3 "$SCRIPT_DIR/graphiti-memory.py" status --json 2>/dev/null)
+    if [ -n "$DAEMON_STATUS" ] && [ "$(echo "$DAEMON_STATUS" | jq -r '.ok' 2>/dev/null)" = "true" ]; then
+        local paused
+        paused=$(echo "$DAEMON_STATUS" | jq -r '.paused')
+        
+        if echo "$DAEMON_STATUS" | jq -e '.sources.files' >/dev/null 2>&1; then
+            FILE_SYNC_OK=true
+            FILE_SYNC_DAEMON_MSG="${GREEN}✓${NC} File sync running (graphiti-memory daemon)"
+            FILE_SYNC_LAST=$(echo "$DAEMON_STATUS" | jq -r '.sources.files.last_run // "never"')
+        else
+            FILE_SYNC_DAEMON_MSG="${RED}✗${NC} File sync source not enabled in daemon"
+        fi
+        
+        if echo "$DAEMON_STATUS" | jq -e '.sources.sessions' >/dev/null 2>&1; then
+            SESSION_SYNC_OK=true
+            SESSION_SYNC_DAEMON_MSG="${GREEN}✓${NC} Session sync running (graphiti-memory daemon)"
+            SESSION_SYNC_LAST=$(echo "$DAEMON_STATUS" | jq -r '.sources.sessions.last_run // "never"')
+        else
+            SESSION_SYNC_DAEMON_MSG="${RED}✗${NC} Session sync source not enabled in daemon"
+        fi
+        
+        if [ "$paused" = "true" ]; then
+            FILE_SYNC_OK=false
+            SESSION_SYNC_OK=false
+            FILE_SYNC_DAEMON_MSG="${YELLOW}⚠${NC} graphiti-memory daemon is paused"
+            SESSION_SYNC_DAEMON_MSG="${YELLOW}⚠${NC} graphiti-memory daemon is paused"
+        fi
     else
-        FILE_SYNC_DAEMON_MSG="${RED}✗${NC} File sync daemon not loaded"
-    fi
-    
-    if launchctl list 2>/dev/null | grep -q "com.clawd.graphiti-sync"; then
-        SESSION_SYNC_OK=true
-        SESSION_SYNC_DAEMON_MSG="${GREEN}✓${NC} Session sync daemon running"
-    else
-        SESSION_SYNC_DAEMON_MSG="${RED}✗${NC} Session sync daemon not loaded"
-    fi
-}
-
-# Check last sync times
-check_sync_times() {
-    LOG_DIR="$HOME/.clawdbot/logs"
-    
-    if [ -f "$LOG_DIR/graphiti-file-sync.log" ]; then
-        FILE_SYNC_LAST=$(stat -f %Sm "$LOG_DIR/graphiti-file-sync.log" 2>/dev/null | sed 's/ / T/')
-    fi
-    
-    if [ -f "$LOG_DIR/graphiti-sync.log" ]; then
-        SESSION_SYNC_LAST=$(stat -f %Sm "$LOG_DIR/graphiti-sync.log" 2>/dev/null | sed 's/ / T/')
+        FILE_SYNC_DAEMON_MSG="${RED}✗${NC} graphiti-memory daemon not running"
+        SESSION_SYNC_DAEMON_MSG="${RED}✗${NC} graphiti-memory daemon not running"
     fi
 }
 
@@ -118,7 +124,6 @@ check_qmd
 check_graphiti
 check_docker
 check_daemons
-check_sync_times
 
 # Output
 if [ "$JSON_MODE" = true ]; then
@@ -1,8 +1,51 @@
 #!/usr/bin/env python3
-"""Patch all agent AGENTS.md files with shared memory section."""
-import os, re
+"""
+Patch agent AGENTS.md files with the shared memory section.
+
+The section lives in a marked block that records the snippet version and a
+hash of its text:
+
+  <!-- graphiti-shared-memory:begin v=2 sha=1a2b3c4d5e6f -->
+  ## 🧠 Shared Memory (Graphiti)
+  ...
+  <!-- graphiti-shared-memory:end -->
+
+A file is rewritten only when its block is missing, from an older snippet
+version, or edited by hand; anything outside the block is left alone.
+An unmarked "## 🧠 Shared Memory (Graphiti)" section written by earlier
+versions of this script is replaced by the block, from its heading to the
+old snippet's closing "Full docs: ..." line and "---"; text around it is
+kept. Any other Shared Memory section (copied from
+templates/shared-memory-snippet.md, written by hand, or an old section
+whose closing lines were edited away) is reported and left alone; --force
+replaces it up to the next "## " heading.
+
+The stat and content hash of every file are kept in
+~/.clawdbot/shared-memory-patch.json, so files untouched since the last run
+are skipped without being read. Files are processed in parallel and
+written atomically, and re-running with nothing to change is a no-op.
+
+To roll out a new snippet, edit SNIPPET_TEMPLATE and bump SNIPPET_VERSION.
+
+Usage:
+  patch-shared-memory.py [--all] [--agents-dir DIR] [--jobs N]
+                         [--dry-run] [--check] [--force]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from graphiti_memory.state import StateStore, atomic_write_text  # noqa: E402
 
 AGENTS_DIR = os.path.expanduser("~/clawd/agents")
+STATE_FILE = "shared-memory-patch.json"
 
 AGENTS = {
     "hazel": ("Hazel", "Household changes, service provider updates, maintenance findings."),
@@ -24,8 +67,12 @@ AGENTS = {
     "sage": ("Sage", "Research findings, competitive intelligence, industry trends."),
 }
 
-def make_snippet(agent_id, name, hint):
-    return f"""
+# Used with --all for agents not listed above
+DEFAULT_HINT = "Decisions, discoveries and task results other agents may need."
+
+SNIPPET_VERSION = 2
+
+SNIPPET_TEMPLATE = """\
 ## 🧠 Shared Memory (Graphiti)
 
 You have access to a **shared knowledge graph** that all agents contribute to. Use it for context.
@@ -40,6 +87,7 @@ You have access to a **shared knowledge graph** that all agents contribute to. U
 ```bash
 ~/clawd/agents/_shared/bin/graphiti-log.sh {agent_id} assistant "{name}" "Important fact here"
 ```
+Logging is queued and returns immediately; your own searches show queued facts as pending. Add `--sync` (first argument) when you must know Graphiti accepted the fact.
 
 **What to log:** {hint}
 **What NOT to log:** Routine status, temporary task state, raw data dumps.
@@ -47,40 +95,247 @@ You have access to a **shared knowledge graph** that all agents contribute to. U
 Full docs: ~/clawd/agents/_shared/graphiti-memory.md
 
 ---
-
 """
 
-for agent_id, (name, hint) in AGENTS.items():
-    path = os.path.join(AGENTS_DIR, agent_id, "AGENTS.md")
-    if not os.path.exists(path):
-        print(f"⚠️  {agent_id}: AGENTS.md not found")
-        continue
-    
-    content = open(path).read()
-    if "Shared Memory" in content:
-        print(f"✅ {agent_id}: already patched")
-        continue
-    
-    snippet = make_snippet(agent_id, name, hint)
-    
-    # Find insertion point
-    for pattern in [r'^## Mission', r'^## Memory', r'^## Every Session']:
+BEGIN_MARKER = "<!-- graphiti-shared-memory:begin"
+END_MARKER = "<!-- graphiti-shared-memory:end -->"
+BEGIN_RE = re.compile(r'<!-- graphiti-shared-memory:begin v=(\d+) sha=([0-9a-f]+) -->\n')
+
+# Unmarked section written by the script before the marker block. It was
+# inserted as "\n" + section + "\n", and always ended with LEGACY_END.
+LEGACY_HEADING_RE = re.compile(r'^## 🧠 Shared Memory \(Graphiti\)[ \t]*$', re.MULTILINE)
+LEGACY_END = "Full docs: ~/clawd/agents/_shared/graphiti-memory.md\n\n---\n"
+# Any other Shared Memory section: the template's, or one written by hand
+OTHER_HEADING_RE = re.compile(r'^##[ \t]+.*\bShared Memory\b.*$', re.MULTILINE)
+NEXT_HEADING_RE = re.compile(r'^## ', re.MULTILINE)
+INSERT_BEFORE = [r'^## Mission', r'^## Memory', r'^## Every Session']
+
+
+def snippet_sha(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+
+
+def make_block(agent_id, name, hint):
+    body = SNIPPET_TEMPLATE.format(agent_id=agent_id, name=name, hint=hint)
+    sha = snippet_sha(body)
+    return f"{BEGIN_MARKER} v={SNIPPET_VERSION} sha={sha} -->\n{body}{END_MARKER}\n", sha
+
+
+def find_block(content):
+    """Locate the marked block. Returns (start, end, version, sha, body) or None."""
+    start = content.find(BEGIN_MARKER)
+    if start < 0:
+        return None
+    end = content.find(END_MARKER, start)
+    m = BEGIN_RE.match(content, start)
+    if end < 0 or not m:
+        return None
+    end += len(END_MARKER)
+    if content.startswith("\n", end):
+        end += 1
+    body = content[m.end():content.rfind(END_MARKER, start, end)]
+    return start, end, int(m.group(1)), m.group(2), body
+
+
+def legacy_span(content, m):
+    """(start, end) of the old script's section at heading match m,
+    including the blank lines it added around it, or None if its closing
+    lines are missing."""
+    end = content.find(LEGACY_END, m.end())
+    if end < 0 or NEXT_HEADING_RE.search(content, m.end(), end):
+        return None
+    end += len(LEGACY_END)
+    if content.startswith("\n", end):
+        end += 1
+    start = m.start()
+    if content[:start] == "\n" or content[:start].endswith("\n\n"):
+        start -= 1
+    return start, end
+
+
+def migrate_section(content, span, block):
+    """Put the block where the old script's section was, spaced the way a
+    fresh patch would be."""
+    before, after = content[:span[0]], content[span[1]:]
+    if before and not before.endswith("\n\n"):
+        before += "\n"
+    return before + block + "\n" + after
+
+
+def replace_section(content, m, block):
+    """Replace the section starting at heading match m, up to the next
+    heading, with the block."""
+    nxt = NEXT_HEADING_RE.search(content, m.end())
+    end = nxt.start() if nxt else len(content)
+    # Don't leave a stack of blank lines where the section was
+    before = content[:m.start()]
+    if before.endswith("\n\n\n"):
+        before = before.rstrip("\n") + "\n\n"
+    return before + block + "\n" + content[end:]
+
+
+def apply_block(content, block, force=False):
+    """Return (content, status, heading) with the block replacing an old
+    block or legacy section, or inserted before the first known section.
+    Other Shared Memory sections are left alone ("unmanaged") unless force
+    is set; heading names the section replaced or left alone."""
+    found = find_block(content)
+    if found:
+        start, end = found[0], found[1]
+        return content[:start] + block + content[end:], "updated", None
+
+    m = LEGACY_HEADING_RE.search(content)
+    span = legacy_span(content, m) if m else None
+    if span:
+        return migrate_section(content, span, block), "migrated", m.group(0).strip()
+
+    m = OTHER_HEADING_RE.search(content)
+    if m:
+        if not force:
+            return content, "unmanaged", m.group(0).strip()
+        return replace_section(content, m, block), "replaced", m.group(0).strip()
+
+    for pattern in INSERT_BEFORE:
         m = re.search(pattern, content, re.MULTILINE)
         if m:
-            pos = m.start()
-            content = content[:pos] + snippet + content[pos:]
-            break
-    else:
-        # Fallback: insert after first ---
-        idx = content.find('---')
-        if idx > 0:
-            idx = content.find('\n', idx) + 1
-            content = content[:idx] + snippet + content[idx:]
-        else:
-            content = snippet + content
-    
-    with open(path, 'w') as f:
-        f.write(content)
-    print(f"✅ {agent_id}: patched")
-
-print("\nDone.")
+            return content[:m.start()] + block + "\n" + content[m.start():], "patched", None
+    # Fallback: insert after the first ---
+    idx = content.find('---')
+    if idx > 0:
+        idx = content.find('\n', idx) + 1
+        return content[:idx] + "\n" + block + "\n" + content[idx:], "patched", None
+    return block + "\n" + content, "patched", None
+
+
+def stat_key(st):
+    return [st.st_mtime_ns, st.st_size]
+
+
+def patch_file(agent_id, name, hint, path, record, force=False, dry_run=False):
+    """Bring one AGENTS.md up to date. Returns (status, new state record or
+    None, heading of the section replaced or left alone)."""
+    block, sha = make_block(agent_id, name, hint)
+    snippet = f"v{SNIPPET_VERSION}:{sha}"
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return "missing", None, None
+
+    # Unchanged since we last saw it current: no need to read it
+    if not force and record and record.get("snippet") == snippet and record.get("stat") == stat_key(st):
+        return "current", record, None
+
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    if not force and record and record.get("snippet") == snippet and record.get("sha256") == digest:
+        return "current", dict(record, stat=stat_key(st)), None
+
+    found = find_block(content)
+    if not force and found and found[2] == SNIPPET_VERSION and found[3] == sha and snippet_sha(found[4]) == sha:
+        return "current", {"snippet": snippet, "sha256": digest, "stat": stat_key(st)}, None
+
+    new_content, status, heading = apply_block(content, block, force)
+    if status == "unmanaged":
+        # No record, so it is reported again on every run until resolved
+        return status, None, heading
+    if new_content == content:
+        return "current", {"snippet": snippet, "sha256": digest, "stat": stat_key(st)}, None
+    if dry_run:
+        return status, None, heading
+
+    # Don't clobber an edit made while we were working; the next run retries
+    if stat_key(os.stat(path)) != stat_key(st):
+        return "changed", None, None
+    atomic_write_text(path, new_content, mode=st.st_mode & 0o7777)
+    new_st = os.stat(path)
+    return status, {
+        "snippet": snippet,
+        "sha256": hashlib.sha256(new_content.encode('utf-8')).hexdigest(),
+        "stat": stat_key(new_st),
+    }, heading
+
+
+def discover_agents(agents_dir, include_all):
+    """(agent_id, name, hint) for the known agents, plus every agent
+    directory with an AGENTS.md when include_all is set."""
+    agents = [(agent_id, name, hint) for agent_id, (name, hint) in AGENTS.items()]
+    if include_all and os.path.isdir(agents_dir):
+        for entry in sorted(os.scandir(agents_dir), key=lambda e: e.name):
+            if entry.name in AGENTS or entry.name.startswith(("_", ".")) or not entry.is_dir():
+                continue
+            if os.path.exists(os.path.join(entry.path, "AGENTS.md")):
+                agents.append((entry.name, entry.name.capitalize(), DEFAULT_HINT))
+    return agents
+
+
+STATUS_LINES = {
+    "patched": "✅ {}: patched",
+    "updated": "🔄 {}: updated to v{}",
+    "migrated": "🔄 {}: replaced unmarked '{heading}' section with v{}",
+    "replaced": "🔄 {}: replaced '{heading}' section with v{} (--force)",
+    "unmanaged": "⚠️  {}: has its own '{heading}' section, left alone (--force replaces it)",
+    "missing": "⚠️  {}: AGENTS.md not found",
+    "changed": "⚠️  {}: changed while patching, skipped (re-run to retry)",
+    "error": "❌ {}: {}",
+}
+CHANGES = ("patched", "updated", "migrated", "replaced")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Patch agent AGENTS.md files with the shared memory section")
+    parser.add_argument("--agents-dir", default=AGENTS_DIR)
+    parser.add_argument("--all", action="store_true",
+                        help="Also patch agent directories not listed in AGENTS")
+    parser.add_argument("--jobs", type=int, default=min(32, (os.cpu_count() or 1) * 4))
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing")
+    parser.add_argument("--check", action="store_true",
+                        help="Like --dry-run, but exit 1 if any file is out of date")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore recorded hashes and re-check every file, and replace "
+                             "Shared Memory sections the script did not write")
+    args = parser.parse_args()
+    dry_run = args.dry_run or args.check
+
+    state = StateStore()
+    doc = state.load(STATE_FILE, lambda: {"files": {}})
+    records = doc["files"]
+
+    agents = discover_agents(args.agents_dir, args.all)
+    paths = {agent_id: os.path.realpath(os.path.join(args.agents_dir, agent_id, "AGENTS.md"))
+             for agent_id, _, _ in agents}
+
+    def work(agent):
+        agent_id, name, hint = agent
+        path = paths[agent_id]
+        try:
+            return patch_file(agent_id, name, hint, path, records.get(path), args.force, dry_run)
+        except (OSError, UnicodeDecodeError) as e:
+            return "error", str(e), None
+
+    counts = {}
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for (agent_id, _, _), (status, result, heading) in zip(agents, pool.map(work, agents)):
+            counts[status] = counts.get(status, 0) + 1
+            if status == "error":
+                print(STATUS_LINES["error"].format(agent_id, result))
+                continue
+            if status in STATUS_LINES:
+                line = STATUS_LINES[status].format(agent_id, SNIPPET_VERSION, heading=heading)
+                print(line + (" (dry run)" if dry_run and status in CHANGES else ""))
+            if result is not None and records.get(paths[agent_id]) != result:
+                records[paths[agent_id]] = result
+                state.mark_dirty(STATE_FILE)
+
+    if not dry_run:
+        state.save()
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    print(f"\nDone: {summary or 'no agents'} (snippet v{SNIPPET_VERSION}).")
+    if args.check and any(s in counts for s in CHANGES + ("unmanaged",)):
+        sys.exit(1)
+    if "error" in counts:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()